@@ -13,14 +13,47 @@ Rules:
 Notes:
 - Intended to be conservative; adjust the path filters if you want to include
     docs/tests.
+- Git lookups go through pygit2 (libgit2) in-process when it is installed, which
+  avoids one `git` subprocess per lookup. Without pygit2 the `git` CLI is used.
 """
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 import subprocess
 import sys
-import tomllib
 from pathlib import Path
+from typing import Any
+
+# pygit2 is optional; without it every lookup falls back to the git CLI
+pygit2: Any
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Patch segment with optional pre-release suffix, e.g. "7b1" -> ("7", "b1")
+_SEMVER_SUFFIX_RE = re.compile(r"(\d+)(.*)")
+
+# Pre-release suffix and its ordering: a < b < rc < release ("")
+_PRE_RE = re.compile(r"(a|b|rc)(\d+)")
+_PRE_RANK = {"a": 0, "b": 1, "rc": 2, "": 3}
+
+# `[project]` table header and a `version = "..."` (or '...') line inside it
+_PROJECT_RE = re.compile(rb"(?m)^\s*\[project\][ \t]*(?:#.*)?$")
+_VERSION_RE = re.compile(rb"""(?m)^\s*version\s*=\s*(?:"([^"]+)"|'([^']+)')""")
+
+
+def open_repo() -> Any:
+    """Open the current repository with pygit2, or return None to use the CLI."""
+    if pygit2 is None:
+        return None
+    try:
+        return pygit2.Repository(".")
+    except pygit2.GitError:
+        return None
 
 
 def run(cmd: list[str]) -> str:
@@ -32,109 +65,153 @@ def run(cmd: list[str]) -> str:
     return result.stdout
 
 
-def parse_version(version: str) -> tuple[int, int, int, str]:
-    """Parse version string, handling pre-release suffixes like 'b1', 'a1', 'rc1'."""
-    import re
+@functools.lru_cache(maxsize=64)
+def parse_version(version: str) -> tuple[int, int, int, int, int, int]:
+    """Parse version string into a tuple that compares in release order.
 
-    version_str = version.lstrip("v")
-    major, minor, patch_with_suffix = version_str.split(".")
+    Returns (major, minor, patch, release_rank, pre_kind_rank, pre_num), where
+    release_rank is 1 for releases and 0 for pre-releases like 'a1', 'b1', 'rc1'.
+    """
+    try:
+        major, minor, patch_with_suffix = version.lstrip("v").split(".")
+    except ValueError:
+        raise ValueError(f"Unsupported version: {version!r}") from None
 
-    # Extract patch number and optional pre-release suffix (e.g., "7b1" -> "7", "b1")
-    match = re.match(r"(\d+)(.*)", patch_with_suffix)
-    if match:
-        patch = match.group(1)
-        suffix = match.group(2)  # e.g., "b1", "a1", "rc1", or ""
-    else:
-        patch = patch_with_suffix
-        suffix = ""
+    # Fast path: plain release "X.Y.Z" needs no regex
+    try:
+        return (int(major), int(minor), int(patch_with_suffix), 1, _PRE_RANK[""], 0)
+    except ValueError:
+        pass
 
-    return (int(major), int(minor), int(patch), suffix)
+    # Extract patch number and pre-release suffix (e.g., "7b1" -> "7", "b1")
+    match = _SEMVER_SUFFIX_RE.match(patch_with_suffix)
+    pre = _PRE_RE.fullmatch(match.group(2)) if match else None
+    if match is None or pre is None:
+        raise ValueError(f"Unsupported version: {version!r}")
+
+    kind, number = pre.groups()
+    patch = int(match.group(1))
+    return (int(major), int(minor), patch, 0, _PRE_RANK[kind], int(number))
 
 
 def is_version_greater_than(version1: str, version2: str) -> bool:
     """Compare versions, where pre-release versions are less than release versions."""
-    v1 = parse_version(version1)
-    v2 = parse_version(version2)
-
-    # Compare major, minor, patch first
-    if v1[:3] != v2[:3]:
-        return v1[:3] > v2[:3]
-
-    # If major.minor.patch are equal, compare suffixes
-    # Empty suffix (release) > any suffix (pre-release)
-    # For pre-releases: rc > b > a, then compare numbers
-    suffix1, suffix2 = v1[3], v2[3]
+    return parse_version(version1) > parse_version(version2)
 
-    if suffix1 == suffix2:
-        return False  # Same version
 
-    if suffix1 == "":
-        return True  # Release > pre-release
-    if suffix2 == "":
-        return False  # Pre-release < release
+def version_from_pyproject(raw: bytes) -> str:
+    """Read `[project].version` from pyproject.toml bytes without a TOML parse.
 
-    # Both have suffixes - compare them
-    # (simplified: any pre-release of higher patch wins)
-    return v1[:3] >= v2[:3]
+    Only a literal `version = "..."` or `version = '...'` line inside the
+    `[project]` table is recognised; a missing table or version (including
+    `dynamic = ["version"]`) raises KeyError, like indexing the parsed TOML.
+    """
+    header = _PROJECT_RE.search(raw)
+    if header is None:
+        raise KeyError("project")
+    start = header.end()
+    end = raw.find(b"\n[", start)
+    match = _VERSION_RE.search(raw, start, len(raw) if end == -1 else end)
+    if match is None:
+        raise KeyError("version")
+    return (match.group(1) or match.group(2)).decode("utf-8")
 
 
 def load_version_from_toml(path: Path) -> str:
-    data = tomllib.loads(path.read_bytes().decode("utf-8"))
-    return str(data["project"]["version"])
+    return version_from_pyproject(path.read_bytes())
 
 
-def load_version_from_git(ref: str, path: str) -> str | None:
+@functools.lru_cache(maxsize=32)
+def load_version_from_git(ref: str, path: str, repo: Any = None) -> str | None:
     try:
-        raw = run(["git", "show", f"{ref}:{path}"])
-        data = tomllib.loads(raw)
-        return str(data["project"]["version"])
+        if repo is not None:
+            tree = repo.revparse_single(ref).peel(pygit2.Tree)
+            raw = tree[path].data
+        else:
+            raw = run(["git", "show", f"{ref}:{path}"]).encode("utf-8")
+        return version_from_pyproject(raw)
     except Exception:
         return None
 
 
-def staged_files() -> list[str]:
-    out = run(["git", "diff", "--cached", "--name-only"])
-    return [line.strip() for line in out.splitlines() if line.strip()]
+def has_head(repo: Any = None) -> bool:
+    """Return False on an initial commit / empty repo (unborn HEAD)."""
+    if repo is not None:
+        return not repo.head_is_unborn
+    try:
+        subprocess.run(
+            ["git", "rev-parse", "--verify", "-q", "HEAD"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+def staged_files(repo: Any = None) -> list[str]:
+    """Staged paths, including deletions (removing a module needs a bump too)."""
+    if repo is not None:
+        head = repo.head.peel(pygit2.Tree)
+        index_file = os.environ.get("GIT_INDEX_FILE")
+        if index_file:
+            # `git commit -a` / `git commit <paths>` stage into a temporary
+            # index that repo.index (always .git/index) does not see
+            staged = repo[pygit2.Index(index_file).write_tree(repo)]
+            diff = repo.diff(head, staged)
+        else:
+            diff = repo.index.diff_to_tree(head)
+        return [delta.new_file.path for delta in diff.deltas]
+    out = run(["git", "diff", "--cached", "--name-only", "-z"])
+    return out.split("\0")[:-1]
 
 
-def touches_xlr8_python(files: list[str]) -> bool:
+def classify(files: list[str]) -> tuple[bool, bool]:
+    """Return (python_changed, rust_changed), stopping once both are known."""
+    python_changed = rust_changed = False
     for file in files:
-        if file.startswith("src/xlr8/"):
-            # ignore docs-ish changes inside package if you ever add them
-            if file.endswith(".md"):
-                continue
-            return True
-    return False
-
-
-def touches_xlr8_rust(files: list[str]) -> bool:
-    return any(f.startswith("rust/xlr8_rust/") for f in files)
+        # ignore docs-ish changes inside package if you ever add them
+        if (
+            not python_changed
+            and file.startswith("src/xlr8/")
+            and not file.endswith(".md")
+        ):
+            python_changed = True
+        if not rust_changed and file.startswith("rust/xlr8_rust/"):
+            rust_changed = True
+        if python_changed and rust_changed:
+            break
+    return python_changed, rust_changed
+
+
+def fail(message: str) -> int:
+    print("\nERROR: version bump required\n", file=sys.stderr)
+    print(f"- {message}", file=sys.stderr)
+    return 1
 
 
 def main() -> int:
+    repo = open_repo()
+
     # Skip on initial commit / empty repo situations.
-    try:
-        subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
+    if not has_head(repo):
         return 0
 
-    files = staged_files()
+    files = staged_files(repo)
     if not files:
         print("No staged changes; skipping version check")
         return 0
 
-    python_changed = touches_xlr8_python(files)
-    rust_changed = touches_xlr8_rust(files)
+    python_changed, rust_changed = classify(files)
 
     if not (python_changed or rust_changed):
         print("No xlr8 package changes; skipping version check")
         return 0
 
-    errors: list[str] = []
-
     if python_changed:
         current = load_version_from_toml(Path("pyproject.toml"))
-        previous = load_version_from_git("origin/main", "pyproject.toml")
+        previous = load_version_from_git("origin/main", "pyproject.toml", repo)
         if previous is None:
             print(
                 f"Python package version check: current={current}, "
@@ -142,15 +219,21 @@ def main() -> int:
             )
         else:
             print(f"Python package version check: current={current}, main={previous}")
-            if not is_version_greater_than(current, previous):
-                errors.append(
+            try:
+                bumped = is_version_greater_than(current, previous)
+            except ValueError as e:
+                return fail(f"Python package version check failed: {e}")
+            if not bumped:
+                return fail(
                     "Python package version bump required: update pyproject.toml "
                     f"so version is > {previous} (current {current})."
                 )
 
     if rust_changed:
         current = load_version_from_toml(Path("rust/xlr8_rust/pyproject.toml"))
-        previous = load_version_from_git("origin/main", "rust/xlr8_rust/pyproject.toml")
+        previous = load_version_from_git(
+            "origin/main", "rust/xlr8_rust/pyproject.toml", repo
+        )
         if previous is None:
             print(
                 f"Rust package version check: current={current}, "
@@ -158,19 +241,17 @@ def main() -> int:
             )
         else:
             print(f"Rust package version check: current={current}, main={previous}")
-            if not is_version_greater_than(current, previous):
-                errors.append(
+            try:
+                bumped = is_version_greater_than(current, previous)
+            except ValueError as e:
+                return fail(f"Rust package version check failed: {e}")
+            if not bumped:
+                return fail(
                     "Rust package version bump required: update "
                     "rust/xlr8_rust/pyproject.toml "
                     f"so version is > {previous} (current {current})."
                 )
 
-    if errors:
-        print("\nERROR: version bump required\n", file=sys.stderr)
-        for err in errors:
-            print(f"- {err}", file=sys.stderr)
-        return 1
-
     print("Version bump check passed")
     return 0
 
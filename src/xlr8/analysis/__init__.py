@@ -3,34 +3,78 @@ Query analysis and execution planning.
 
 This module provides utilities for analyzing MongoDB queries and
 creating optimal execution plans for parallel processing.
+
+Exports are resolved lazily on first access, so importing this package
+does not load brackets, chunker and inspector until a name is needed.
 """
 
-from .brackets import (
-    build_brackets_for_find,
-)
-from .chunker import (
-    chunk_time_range,
-)
-from .inspector import (
-    # Operator classification sets
-    ALWAYS_ALLOWED,
-    CONDITIONAL,
-    NEVER_ALLOWED,
-    # Validation
-    ValidationResult,
-    check_conditional_operators,
-    extract_time_bounds_recursive,
-    generate_sort_sql,
-    get_sort_field_info,
-    has_forbidden_ops,
-    is_chunkable_query,
-    normalize_datetime,
-    # Query analysis
-    or_depth,
-    split_global_and,
-    validate_query_for_chunking,
-    validate_sort_field,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .brackets import build_brackets_for_find as build_brackets_for_find
+    from .chunker import chunk_time_range as chunk_time_range
+    from .inspector import ALWAYS_ALLOWED as ALWAYS_ALLOWED
+    from .inspector import CONDITIONAL as CONDITIONAL
+    from .inspector import NEVER_ALLOWED as NEVER_ALLOWED
+    from .inspector import ValidationResult as ValidationResult
+    from .inspector import (
+        check_conditional_operators as check_conditional_operators,
+    )
+    from .inspector import (
+        extract_time_bounds_recursive as extract_time_bounds_recursive,
+    )
+    from .inspector import generate_sort_sql as generate_sort_sql
+    from .inspector import get_sort_field_info as get_sort_field_info
+    from .inspector import has_forbidden_ops as has_forbidden_ops
+    from .inspector import is_chunkable_query as is_chunkable_query
+    from .inspector import normalize_datetime as normalize_datetime
+    from .inspector import or_depth as or_depth
+    from .inspector import split_global_and as split_global_and
+    from .inspector import (
+        validate_query_for_chunking as validate_query_for_chunking,
+    )
+    from .inspector import validate_sort_field as validate_sort_field
+
+# Exported name -> submodule that defines it
+_LAZY: dict[str, str] = {
+    # brackets
+    "build_brackets_for_find": "brackets",
+    # chunker
+    "chunk_time_range": "chunker",
+    # inspector - operator sets
+    "ALWAYS_ALLOWED": "inspector",
+    "CONDITIONAL": "inspector",
+    "NEVER_ALLOWED": "inspector",
+    # inspector - validation
+    "ValidationResult": "inspector",
+    "has_forbidden_ops": "inspector",
+    "validate_query_for_chunking": "inspector",
+    "validate_sort_field": "inspector",
+    "get_sort_field_info": "inspector",
+    "generate_sort_sql": "inspector",
+    "check_conditional_operators": "inspector",
+    # inspector - analysis
+    "or_depth": "inspector",
+    "split_global_and": "inspector",
+    "normalize_datetime": "inspector",
+    "extract_time_bounds_recursive": "inspector",
+    "is_chunkable_query": "inspector",
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY.get(name)
+    if submodule is None:
+        raise AttributeError(f"module 'xlr8.analysis' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # inspector - operator sets
@@ -72,7 +72,7 @@ import json
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from xlr8.analysis.inspector import (
     ChunkabilityMode,
@@ -116,11 +116,11 @@ __all__ = [
 # =============================================================================
 
 # Operators that create negation/exclusion filters
-NEGATION_OPERATORS: Set[str] = {"$nin", "$ne", "$not", "$nor"}
+NEGATION_OPERATORS: set[str] = {"$nin", "$ne", "$not", "$nor"}
 
 # Operators that can cause overlap between branches even with different values
 # These should trigger single-bracket execution when used on differentiating fields
-OVERLAP_PRONE_OPERATORS: Set[str] = {
+OVERLAP_PRONE_OPERATORS: set[str] = {
     "$all",  # Array superset matching
     "$elemMatch",  # Array element matching
     "$regex",  # Pattern matching
@@ -134,14 +134,16 @@ OVERLAP_PRONE_OPERATORS: Set[str] = {
     "$bitsAllClear",
     "$bitsAnyClear",
 }
-#          both match documents where field=3.
-# =============================================================================
 
-# Operators that create negation/exclusion filters
-NEGATION_OPERATORS: Set[str] = {"$nin", "$ne", "$not", "$nor"}
+# Overlap-prone operator -> True if it is allowed on the time field.
+# Comparison operators on the time field are how chunking works; the rest
+# are always problematic. Built once so the per-key check is a single lookup.
+_OVERLAP_TIME_EXEMPT: Dict[str, bool] = {
+    op: op in ("$gt", "$gte", "$lt", "$lte") for op in OVERLAP_PRONE_OPERATORS
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeRange:
     """
     Time range for a bracket.
@@ -170,7 +172,7 @@ class TimeRange:
     lo_inclusive: bool = True  # Default to $gte for backward compatibility
 
 
-@dataclass
+@dataclass(slots=True)
 class Bracket:
     """
     A unit of work for parallel execution.
@@ -270,20 +272,6 @@ def _has_overlap_prone_operators(
         >>> _has_overlap_prone_operators({"value": {"$gt": 10}}, "ts")
         (True, '$gt')  # Non-time field comparison is problematic
     """
-    # Operators that are always problematic (not context-dependent)
-    always_problematic = {
-        "$all",
-        "$elemMatch",
-        "$regex",
-        "$mod",
-        "$bitsAllSet",
-        "$bitsAnySet",
-        "$bitsAllClear",
-        "$bitsAnyClear",
-    }
-
-    # Comparison operators - only problematic on non-time fields
-    comparison_ops = {"$gt", "$gte", "$lt", "$lte"}
 
     def _check(obj: Any, current_field: Optional[str] = None) -> Optional[str]:
         if isinstance(obj, dict):
@@ -291,11 +279,11 @@ def _has_overlap_prone_operators(
                 # Track current field for comparison operator check
                 field = key if not key.startswith("$") else current_field
 
-                if key in always_problematic:
-                    return key
-
                 # Comparison operators are only problematic on non-time fields
-                if key in comparison_ops and current_field != time_field:
+                time_exempt = _OVERLAP_TIME_EXEMPT.get(key)
+                if time_exempt is not None and (
+                    not time_exempt or current_field != time_field
+                ):
                     return key
 
                 result = _check(value, field)
@@ -312,7 +300,7 @@ def _has_overlap_prone_operators(
     return (True, op) if op else (False, None)
 
 
-def _extract_in_values(query: Dict[str, Any], field: str) -> Optional[Set[Any]]:
+def _extract_in_values(query: Dict[str, Any], field: str) -> Optional[set[Any]]:
     """
     Extract $in values for a specific field from query.
 
@@ -351,7 +339,7 @@ def _extract_in_values(query: Dict[str, Any], field: str) -> Optional[Set[Any]]:
     return None
 
 
-def _find_in_fields(query: Dict[str, Any]) -> Dict[str, Set[Any]]:
+def _find_in_fields(query: Dict[str, Any]) -> Dict[str, set[Any]]:
     """
     Find all fields that use $in operator and their values.
 
@@ -369,7 +357,7 @@ def _find_in_fields(query: Dict[str, Any]) -> Dict[str, Set[Any]]:
         >>> _find_in_fields({"a": 5, "b": {"$gt": 10}})
         {}
     """
-    result: Dict[str, Set[Any]] = {}
+    result: Dict[str, set[Any]] = {}
 
     for field, value in query.items():
         if field.startswith("$"):
@@ -386,7 +374,7 @@ def _find_in_fields(query: Dict[str, Any]) -> Dict[str, Set[Any]]:
     return result
 
 
-def _get_non_time_fields(branch: Dict[str, Any], time_field: str) -> Set[str]:
+def _get_non_time_fields(branch: Dict[str, Any], time_field: str) -> set[str]:
     """Get all top-level field names except the time field and operators."""
     return {k for k in branch.keys() if not k.startswith("$") and k != time_field}
 
@@ -445,13 +433,9 @@ def _check_or_branch_safety(
     effective_branches = []
     for br in branches:
         eff = {**global_and, **br}
-        # Remove time field for field comparison
-        if time_field in eff:
-            eff_copy = dict(eff)
-            eff_copy.pop(time_field)
-            effective_branches.append(eff_copy)
-        else:
-            effective_branches.append(eff)
+        # Remove time field for field comparison (eff is already a fresh dict)
+        eff.pop(time_field, None)
+        effective_branches.append(eff)
 
     # Rule 2: Check if all branches have the same field set
     field_sets = [_get_non_time_fields(eb, time_field) for eb in effective_branches]
@@ -462,12 +446,12 @@ def _check_or_branch_safety(
 
     # All branches have same fields - now check for $in overlap
     # Find all $in fields in each branch
-    all_in_fields: List[Dict[str, Set[Any]]] = [
+    all_in_fields: List[Dict[str, set[Any]]] = [
         _find_in_fields(eb) for eb in effective_branches
     ]
 
     # Collect all $in field names across all branches
-    in_field_names: Set[str] = set()
+    in_field_names: set[str] = set()
     for in_dict in all_in_fields:
         in_field_names.update(in_dict.keys())
 
@@ -479,16 +463,16 @@ def _check_or_branch_safety(
 
     # For each $in field, check if all branches use $in on it
     # and identify overlapping values
-    fields_with_overlap: Dict[str, List[Tuple[int, int, Set[Any]]]] = {}
+    fields_with_overlap: Dict[str, List[Tuple[int, int, set[Any]]]] = {}
 
     for field in in_field_names:
         # Get $in values for this field from each branch
-        branch_values: List[Optional[Set[Any]]] = []
+        branch_values: List[Optional[set[Any]]] = []
         for in_dict in all_in_fields:
             branch_values.append(in_dict.get(field))
 
         # Check for overlap between any pair of branches
-        overlaps: List[Tuple[int, int, Set[Any]]] = []
+        overlaps: List[Tuple[int, int, set[Any]]] = []
         for i in range(len(branches)):
             vals_i = branch_values[i]
             if vals_i is None:
@@ -562,7 +546,7 @@ def _check_or_branch_safety(
     # Transform: For each pair with overlap, subtract overlapping values from one branch
     # Strategy: Build a "seen" set and subtract from later branches
     transformed = [deepcopy(br) for br in branches]
-    seen_values: Set[Any] = set()
+    seen_values: set[Any] = set()
 
     for i, branch in enumerate(transformed):
         # Get current $in values for this branch (merged with global)
@@ -980,11 +964,9 @@ def build_brackets_for_find(
                     (branch_lo, branch_hi, branch_hi_inc, branch_lo_inc)
                 )
 
-                # Extract static filter (without time)
-                static_wo_time = dict(combined)
-                if time_field in static_wo_time:
-                    static_wo_time.pop(time_field)
-                static_filters.append(static_wo_time)
+                # Extract static filter (without time); combined is not reused
+                combined.pop(time_field, None)
+                static_filters.append(combined)
 
             # Check if all static filters are identical
             all_static_identical = all(
@@ -1115,10 +1097,7 @@ def build_brackets_for_find(
         if not isinstance(br, Dict):
             return False, "branch-not-dict", [], (None, None)
 
-        eff: Dict[str, Any] = {}
-        if global_and:
-            eff.update(global_and)
-        eff.update(br)
+        eff: Dict[str, Any] = {**global_and, **br}
 
         br_bounds, _ = extract_time_bounds_recursive(eff, time_field)
         if br_bounds is None:
@@ -1127,17 +1106,16 @@ def build_brackets_for_find(
             lo, hi, hi_inclusive, lo_inclusive = br_bounds
         is_full = lo is not None and hi is not None
 
-        # Remove time field from static filter
-        static_wo_time = dict(eff)
-        if time_field in static_wo_time:
-            static_wo_time.pop(time_field)
+        # Remove time field in place; eff is private to this branch, so it
+        # becomes the static filter without a second copy
+        eff.pop(time_field, None)
 
-        if "$or" in static_wo_time:
+        if "$or" in eff:
             return False, "nested-or-in-branch", [], (None, None)
 
         prelim.append(
             Bracket(
-                static_filter=static_wo_time,
+                static_filter=eff,
                 timerange=TimeRange(lo, hi, is_full, hi_inclusive, lo_inclusive),
             )
         )
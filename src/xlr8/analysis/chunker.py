@@ -105,6 +105,10 @@ def chunk_time_range(
     first_boundary = (
         datetime(start.year, start.month, start.day, tzinfo=timezone.utc) + step
     )
+    if first_boundary <= start:
+        # Sub-day step: jump to the next aligned boundary in one go instead of
+        # emitting chunks for the part of the day before start
+        first_boundary += ((start - first_boundary) // step + 1) * step
 
     lo = start
     cur = first_boundary
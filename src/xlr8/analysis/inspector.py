@@ -225,10 +225,11 @@ Common reasons by mode:
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 __all__ = [
     # Classification sets
@@ -420,6 +421,19 @@ NEVER_ALLOWED: frozenset[str] = frozenset(
     }
 )
 
+# Single lookup table for the hot validation path: one dict probe per operator
+# key instead of a membership test against each classification set.
+_OP_ALWAYS = 0
+_OP_CONDITIONAL = 1
+_OP_NEVER = 2
+_OP_UNKNOWN = 3
+
+_OP_CLASS: dict[str, int] = {
+    **{op: _OP_ALWAYS for op in ALWAYS_ALLOWED},
+    **{op: _OP_CONDITIONAL for op in CONDITIONAL},
+    **{op: _OP_NEVER for op in NEVER_ALLOWED},
+}
+
 # =============================================================================
 # VALIDATION RESULT
 # =============================================================================
@@ -533,19 +547,51 @@ def has_forbidden_ops(query: Any) -> Tuple[bool, Optional[str]]:
         >>> has_forbidden_ops({"$and": [{"$text": {"$search": "test"}}]})
         (True, '$text')
     """
-    if isinstance(query, dict):
-        for key, value in query.items():
-            if key in NEVER_ALLOWED:
-                return True, key
-            found, op = has_forbidden_ops(value)
-            if found:
-                return True, op
-    elif isinstance(query, list):
-        for item in query:
-            found, op = has_forbidden_ops(item)
-            if found:
-                return True, op
-    return False, None
+    op = _find_forbidden_op(query)
+    return (True, op) if op is not None else (False, None)
+
+
+# Exhausted-iterator marker for _walk_entries()
+_END: Any = object()
+
+
+def _walk_entries(obj: Any) -> Iterator[Tuple[str, Any, Optional[str]]]:
+    """Yield (key, value, parent_key) for every dict entry in obj.
+
+    Entries come in the order a recursive walk would visit them; parent_key
+    is the key the entry's dict sits under (lists pass it through). Uses an
+    explicit stack of iterators, so deeply nested queries cannot hit the
+    interpreter recursion limit.
+    """
+    stack: List[Tuple[Iterator[Any], Optional[str], bool]] = []
+    if isinstance(obj, dict):
+        stack.append((iter(obj.items()), None, True))
+    elif isinstance(obj, list):
+        stack.append((iter(obj), None, False))
+    while stack:
+        items, parent_key, is_dict = stack[-1]
+        item = next(items, _END)
+        if item is _END:
+            stack.pop()
+            continue
+        if is_dict:
+            key, value = item
+            yield key, value, parent_key
+            parent_key = key
+        else:
+            value = item
+        if isinstance(value, dict):
+            stack.append((iter(value.items()), parent_key, True))
+        elif isinstance(value, list):
+            stack.append((iter(value), parent_key, False))
+
+
+def _find_forbidden_op(obj: Any) -> Optional[str]:
+    """Return the first NEVER_ALLOWED operator key in obj, or None."""
+    for key, _, _ in _walk_entries(obj):
+        if _OP_CLASS.get(key, _OP_UNKNOWN) == _OP_NEVER:
+            return key
+    return None
 
 
 def has_unknown_operators(query: Any) -> Tuple[bool, Optional[str]]:
@@ -572,48 +618,95 @@ def has_unknown_operators(query: Any) -> Tuple[bool, Optional[str]]:
         >>> has_unknown_operators({"value": {"$gt": 100}})
         (False, None)
     """
-    KNOWN_OPS = ALWAYS_ALLOWED | CONDITIONAL | NEVER_ALLOWED
-
-    if isinstance(query, dict):
-        for key, value in query.items():
-            # Check if key is an operator (starts with $) and not in known lists
-            if key.startswith("$") and key not in KNOWN_OPS:
-                return True, key
-            # Recurse into value
-            found, op = has_unknown_operators(value)
-            if found:
-                return True, op
-    elif isinstance(query, list):
-        for item in query:
-            found, op = has_unknown_operators(item)
-            if found:
-                return True, op
-    return False, None
+    op = _find_unknown_op(query)
+    return (True, op) if op is not None else (False, None)
+
+
+def _find_unknown_op(obj: Any) -> Optional[str]:
+    """Return the first unclassified $-operator key in obj, or None."""
+    for key, _, _ in _walk_entries(obj):
+        # Check if key is an operator (starts with $) and not in known lists
+        if key.startswith("$") and key not in _OP_CLASS:
+            return key
+    return None
 
 
 def _references_field(obj: Any, field_name: str) -> bool:
     """Check if query fragment references a specific field name."""
+    return any(key == field_name for key, _, _ in _walk_entries(obj))
+
+
+# _query_shape() markers; ints never collide with (string) query keys
+_SHAPE_DICT, _SHAPE_LIST, _SHAPE_EMPTY_LIST, _SHAPE_CLOSE = range(4)
+
+
+def _query_shape(obj: Any) -> Any:
+    """Return a hashable fingerprint of a query's structure.
+
+    Keys and nesting are kept; scalar values are dropped. Empty lists get
+    their own marker because an empty $or is rejected by validation.
+
+    The fingerprint is a flat token tuple (keys plus open/close markers)
+    built with an explicit stack, so deeply nested queries cannot hit the
+    interpreter recursion limit.
+    """
     if isinstance(obj, dict):
-        if field_name in obj:
-            return True
-        return any(_references_field(v, field_name) for v in obj.values())
+        tokens: List[Any] = [_SHAPE_DICT]
+        stack: List[Tuple[Iterator[Any], bool]] = [(iter(obj.items()), True)]
     elif isinstance(obj, list):
-        return any(_references_field(item, field_name) for item in obj)
-    return False
+        if not obj:
+            return (_SHAPE_EMPTY_LIST,)
+        tokens = [_SHAPE_LIST]
+        stack = [(iter(obj), False)]
+    else:
+        return None
+
+    append = tokens.append
+    while stack:
+        items, is_dict = stack[-1]
+        item = next(items, _END)
+        if item is _END:
+            stack.pop()
+            append(_SHAPE_CLOSE)
+            continue
+        if is_dict:
+            key, value = item
+            append(key)
+        else:
+            value = item
+        if isinstance(value, dict):
+            append(_SHAPE_DICT)
+            stack.append((iter(value.items()), True))
+        elif isinstance(value, list):
+            if value:
+                append(_SHAPE_LIST)
+                stack.append((iter(value), False))
+            else:
+                append(_SHAPE_EMPTY_LIST)
+    return tuple(tokens)
 
 
 def _or_depth(obj: Any, current: int = 0) -> int:
-    """Calculate maximum nesting depth of $or operators."""
-    if isinstance(obj, dict):
-        depth = current + 1 if "$or" in obj else current
-        child_depths = [
-            _or_depth(v, current + 1) if k == "$or" else _or_depth(v, current)
-            for k, v in obj.items()
-        ]
-        return max([depth] + child_depths) if child_depths else depth
-    elif isinstance(obj, list):
-        return max((_or_depth(item, current) for item in obj), default=current)
-    return current
+    """Calculate maximum nesting depth of $or operators.
+
+    Walks the query with an explicit stack of (node, depth) pairs, so deeply
+    nested input cannot hit the interpreter recursion limit.
+    """
+    max_depth = current
+    stack: List[Tuple[Any, int]] = [(obj, current)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, dict):
+            if "$or" in node and depth + 1 > max_depth:
+                max_depth = depth + 1
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    stack.append((value, depth + 1 if key == "$or" else depth))
+        elif isinstance(node, list):
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    stack.append((item, depth))
+    return max_depth
 
 
 def check_conditional_operators(
@@ -658,50 +751,31 @@ def check_conditional_operators(
     if depth > 1:
         return ValidationResult(False, f"nested $or (depth {depth} > 1)")
 
-    # Check for empty $or array
-    def check_empty_or(obj: Any) -> Optional[str]:
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key == "$or" and isinstance(value, list) and len(value) == 0:
-                    return "$or with empty array matches no documents"
-                error = check_empty_or(value)
-                if error:
-                    return error
-        elif isinstance(obj, list):
-            for item in obj:
-                error = check_empty_or(item)
-                if error:
-                    return error
-        return None
-
-    error = check_empty_or(query)
-    if error:
-        return ValidationResult(False, error)
-
-    # Check $nor doesn't reference time field
-    def check_tree(obj: Any, parent_key: Optional[str] = None) -> Optional[str]:
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key == "$nor" and isinstance(value, list):
-                    for clause in value:
-                        if _references_field(clause, time_field):
-                            return f"$nor references time field '{time_field}'"
-                if key == "$not" and parent_key == time_field:
-                    return f"$not applied to time field '{time_field}'"
-                error = check_tree(value, key)
-                if error:
-                    return error
-        elif isinstance(obj, list):
-            for item in obj:
-                error = check_tree(item, parent_key)
-                if error:
-                    return error
-        return None
+    # One pass for the remaining checks; an empty $or anywhere is reported
+    # ahead of $nor/$not problems
+    error = None
+    for key, value, parent_key in _walk_entries(query):
+        if key == "$or" and isinstance(value, list) and len(value) == 0:
+            return ValidationResult(False, "$or with empty array matches no documents")
+        if error is not None:
+            continue
+        # Check $nor doesn't reference time field
+        if key == "$nor" and isinstance(value, list):
+            if any(_references_field(clause, time_field) for clause in value):
+                error = f"$nor references time field '{time_field}'"
+        elif key == "$not" and parent_key == time_field:
+            error = f"$not applied to time field '{time_field}'"
 
-    error = check_tree(query)
     return ValidationResult(False, error) if error else ValidationResult(True)
 
 
+# (query shape, time_field) -> validate_query_for_chunking() result
+_VALIDATION_CACHE: Dict[Tuple[Any, str], Tuple[bool, str]] = {}
+_VALIDATION_CACHE_SIZE = 256
+# Guards eviction + insert; validation may run from several threads
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+
 def validate_query_for_chunking(
     query: Dict[str, Any], time_field: str
 ) -> Tuple[bool, str]:
@@ -749,6 +823,26 @@ def validate_query_for_chunking(
         ... }, "timestamp")
         (False, "operator '$near' requires full dataset (cannot chunk)")
     """
+    # Validation depends only on the query's shape (keys, nesting, empty
+    # lists), so repeated shapes with different values reuse the verdict.
+    key = (_query_shape(query), time_field)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = _validate_query_uncached(query, time_field)
+    with _VALIDATION_CACHE_LOCK:
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)), None)
+        _VALIDATION_CACHE[key] = result
+    return result
+
+
+def _validate_query_uncached(
+    query: Dict[str, Any], time_field: str
+) -> Tuple[bool, str]:
+    """Run the full operator validation for validate_query_for_chunking()."""
     # Check for operators requiring full dataset (cannot chunk/parallelize)
     # Recurses the query tree and returns on first forbidden operator found.
     has_forbidden, op = has_forbidden_ops(query)
@@ -774,15 +868,7 @@ def or_depth(obj: Any, depth: int = 0) -> int:
 
     Returns 0 for no $or, 1 for top-level $or, 2+ for nested.
     """
-    if isinstance(obj, dict):
-        local = 1 if "$or" in obj else 0
-        return max(
-            [depth + local]
-            + [or_depth(v, depth + (1 if k == "$or" else 0)) for k, v in obj.items()]
-        )
-    if isinstance(obj, list):
-        return max((or_depth(x, depth) for x in obj), default=depth)
-    return depth
+    return _or_depth(obj, depth)
 
 
 def split_global_and(
@@ -85,7 +85,6 @@ from __future__ import annotations
 
 from typing import (
     Any,
-    Callable,
     Dict,
     List,
     Optional,
@@ -100,14 +99,17 @@ import logging
 import warnings
 import pandas as pd
 import time
-import pyarrow as pa
 import polars as pl
 
 logger = logging.getLogger(__name__)
 
 # Import after logger to avoid circular imports
 from xlr8.constants import DEFAULT_BATCH_SIZE
-from xlr8.execution.callback import execute_partitioned_callback
+from xlr8.execution.callback import (
+    CallbackStyle,
+    PartitionCallback,
+    execute_partitioned_callback,
+)
 from xlr8.analysis import (
     build_brackets_for_find,
     chunk_time_range,
@@ -967,7 +969,7 @@ class XLR8Cursor:
 
     def stream_to_callback(
         self,
-        callback: Callable[["pa.Table", Dict[str, Any]], None],
+        callback: PartitionCallback,
         *,
         partition_time_delta: timedelta,
         partition_by: Optional[Union[str, List[str]]] = None,
@@ -978,6 +980,7 @@ class XLR8Cursor:
         flush_ram_limit_mb: int = 512,
         cache_read: bool = True,
         cache_write: bool = True,
+        callback_style: CallbackStyle = "batch",
     ) -> Dict[str, Any]:
         """
         Stream partitioned PyArrow tables to a callback function.
@@ -1005,6 +1008,7 @@ class XLR8Cursor:
 
         The callback receives:
         - table: PyArrow Table with data for this partition
+          (a list of row dicts instead when callback_style="row")
         - metadata: Dict with partition info:
             {
                 "time_start": datetime,      # Start of time bucket
@@ -1038,6 +1042,10 @@ class XLR8Cursor:
                         Used during both download and partition phases.
             cache_read: Read from existing cache if available (default: True).
             cache_write: Write to cache during download (default: True).
+            callback_style: What the callback receives per partition:
+                        - "batch": pa.Table, columnar (default)
+                        - "row": List of dicts (Table.to_pylist()), for callbacks
+                          written against rows; costs one Python object per row
 
         Returns:
             Dict with:
@@ -1283,6 +1291,7 @@ class XLR8Cursor:
             max_workers=max_workers,
             sort_ascending=sort_ascending,
             memory_limit_mb=flush_ram_limit_mb,
+            callback_style=callback_style,
         )
 
         total_duration = time.time() - total_start
@@ -8,7 +8,6 @@ from __future__ import annotations
 from datetime import date, datetime, timedelta
 from typing import (
     Any,
-    Callable,
     Dict,
     Generator,
     Generic,
@@ -24,7 +23,6 @@ from typing import (
 
 import pandas as pd
 import polars as pl
-import pyarrow as pa
 from bson.code import Code
 from pymongo.cursor_shared import _Hint, _Sort
 from pymongo.synchronous.client_session import ClientSession
@@ -32,6 +30,8 @@ from pymongo.synchronous.collection import Collection
 from pymongo.synchronous.cursor import Cursor as PyMongoCursor
 from pymongo.typings import _CollationIn
 
+from xlr8.execution.callback import CallbackStyle, PartitionCallback
+
 _DocumentType = TypeVar("_DocumentType", bound=Mapping[str, Any])
 
 class XLR8Cursor(Generic[_DocumentType]):
@@ -163,7 +163,7 @@ class XLR8Cursor(Generic[_DocumentType]):
     ) -> Generator[pd.DataFrame, None, None]: ...
     def stream_to_callback(
         self,
-        callback: Callable[[pa.Table, Dict[str, Any]], None],
+        callback: PartitionCallback,
         *,
         partition_time_delta: timedelta,
         partition_by: Optional[Union[str, List[str]]] = None,
@@ -174,6 +174,7 @@ class XLR8Cursor(Generic[_DocumentType]):
         flush_ram_limit_mb: int = 512,
         cache_read: bool = True,
         cache_write: bool = True,
+        callback_style: CallbackStyle = "batch",
     ) -> Dict[str, Any]: ...
     def raw_cursor(self) -> PyMongoCursor[_DocumentType]: ...
     def explain_acceleration(self) -> Dict[str, Any]: ...
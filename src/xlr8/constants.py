@@ -22,3 +22,14 @@ DEFAULT_COMPRESSION = "zstd"
 
 # Default batch size for DataFrame operations
 DEFAULT_BATCH_SIZE = 10_000
+
+# Target decoded size of each Arrow batch when streaming documents. Wide rows
+# get fewer rows per batch so a batch stays roughly L2-cache sized.
+DEFAULT_BATCH_BYTES = 256 * 1024
+
+# Lower bound on rows per batch chosen by the byte-size heuristic
+MIN_AUTO_BATCH_ROWS = 1_024
+
+# Number of record batches decoded ahead in a background thread while
+# earlier ones are being consumed (bounds the extra memory to a few batches)
+DEFAULT_PREFETCH_BATCHES = 4
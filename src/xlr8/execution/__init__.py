@@ -20,7 +20,11 @@ Rust backend handles:
 - Parquet writing
 """
 
-from .callback import PartitionWorkItem, execute_partitioned_callback
+from .callback import (
+    CallbackStyle,
+    PartitionWorkItem,
+    execute_partitioned_callback,
+)
 from .executor import execute_parallel_stream_to_cache
 from .planner import (
     Backend,
@@ -33,6 +37,7 @@ __all__ = [
     # Executor
     "execute_parallel_stream_to_cache",
     # Callback
+    "CallbackStyle",
     "PartitionWorkItem",
     "execute_partitioned_callback",
     # Planner
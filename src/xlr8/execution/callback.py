@@ -21,6 +21,8 @@ PHASE 2: Partition + Parallel Callbacks
 
     2. Execute callbacks in parallel (ThreadPoolExecutor):
        - Each worker: DuckDB query -> PyArrow Table -> decode -> callback()
+       - Callback gets the columnar Table ("batch" style, default); rows as
+         dicts are only built when callback_style="row" is requested
        - DuckDB releases GIL -> true parallelism
        - User callbacks can use non-picklable objects (boto3, etc.)
 
@@ -38,20 +40,37 @@ EDGE CASES HANDLED:
 """
 
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, cast
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, cast
 
 import polars as pl
 import pyarrow as pa
 
 from xlr8.schema.types import Any as AnyType
 from xlr8.schema.types import ObjectId as ObjectIdType
+from xlr8.storage.cache import file_in_time_range
 
 logger = logging.getLogger(__name__)
 
+# What the user callback receives per partition:
+# - "batch": pa.Table (columnar, no per-row Python objects)
+# - "row": List[Dict[str, Any]] via Table.to_pylist()
+CallbackStyle = Literal["batch", "row"]
+BatchCallback = Callable[[pa.Table, Dict[str, Any]], None]
+RowCallback = Callable[[List[Dict[str, Any]], Dict[str, Any]], None]
+# Either shape is accepted; existing (table, metadata) callbacks keep
+# type-checking because each member keeps its own parameter types
+PartitionCallback = Union[BatchCallback, RowCallback]
+
+# One DuckDB connection per worker thread, reused across its partitions.
+# Connections are never shared between threads (a shared connection
+# serializes workers and can deadlock when several threads use it).
+_tls = threading.local()
+
 
 @dataclass
 class PartitionWorkItem:
@@ -144,6 +163,49 @@ def _timedelta_to_duckdb_interval(td: timedelta) -> str:
         return f"{total_seconds} seconds"
 
 
+def _min_time_from_statistics(
+    parquet_files: List[Path],
+    time_field: str,
+) -> Optional[datetime]:
+    """
+    Minimum of time_field from Parquet footer statistics (no data pages read).
+
+    Returns None if any row group lacks min/max statistics for the column,
+    so the caller can fall back to scanning.
+    """
+    import pyarrow.parquet as pq
+
+    global_min: Optional[datetime] = None
+    for path in parquet_files:
+        metadata = pq.read_metadata(path)
+        column_index = next(
+            (
+                i
+                for i in range(metadata.num_columns)
+                if metadata.schema.column(i).path == time_field
+            ),
+            None,
+        )
+        if column_index is None:
+            return None
+
+        for rg in range(metadata.num_row_groups):
+            stats = metadata.row_group(rg).column(column_index).statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            value = stats.min
+            if not isinstance(value, datetime):
+                return None
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            else:
+                value = value.astimezone(timezone.utc)
+            if global_min is None or value < global_min:
+                global_min = value
+
+    return global_min
+
+
 def _build_partition_plan(
     cache_dir: str,
     time_field: str,
@@ -156,7 +218,8 @@ def _build_partition_plan(
     Build partition plan by discovering unique partitions in the cached data.
 
     Uses DuckDB to efficiently scan all parquet files and find unique
-    (time_bucket, partition_key) combinations.
+    (time_bucket, partition_key) combinations. The global start time comes
+    from Parquet row-group statistics when available (footers only).
 
     Natural Time Boundaries:
     - First partition's start time is floored to the start of the day (00:00:00)
@@ -201,17 +264,19 @@ def _build_partition_plan(
         if threads:
             conn.execute(f"SET threads = {threads}")
 
-        # Get global min and floor to start of day
-        global_result = cast(
-            Optional[Tuple[Any, ...]],
-            conn.execute(global_min_query).fetchone(),
-        )
-        if global_result is None or global_result[0] is None:
-            logger.warning("No data found in parquet files")
-            conn.close()
-            return []
+        # Get global min (footer statistics, else scan) and floor to start of day
+        global_min_time: Any = _min_time_from_statistics(parquet_files, time_field)
+        if global_min_time is None:
+            global_result = cast(
+                Optional[Tuple[Any, ...]],
+                conn.execute(global_min_query).fetchone(),
+            )
+            if global_result is None or global_result[0] is None:
+                logger.warning("No data found in parquet files")
+                conn.close()
+                return []
 
-        global_min_time = global_result[0]
+            global_min_time = global_result[0]
 
         # Ensure timezone aware
         if hasattr(global_min_time, "tzinfo") and global_min_time.tzinfo is None:
@@ -266,8 +331,10 @@ def _build_partition_plan(
             ORDER BY time_bucket
         """
 
-        result = conn.execute(query).fetchall()
-        columns = [desc[0] for desc in conn.execute(query).description]  # type: ignore[union-attr]
+        # Run the aggregation once; column names come from the same result
+        cursor = conn.execute(query)
+        columns = [desc[0] for desc in cursor.description]  # type: ignore[union-attr]
+        result = cursor.fetchall()
         conn.close()
 
         # Build work items from results
@@ -330,6 +397,10 @@ def _build_partition_query(
     """
     Build DuckDB query to fetch data for a single partition.
 
+    Only files whose ts_{min}_{max} name overlaps the partition's time bucket
+    are read, so each partition scans its own files rather than the whole
+    cache (DuckDB then prunes row groups within them by statistics).
+
     Args:
         cache_dir: Path to cache directory
         time_field: Timestamp field name
@@ -341,7 +412,12 @@ def _build_partition_query(
     """
     cache_path = Path(cache_dir)
     parquet_files = list(cache_path.glob("*.parquet"))
-    files_list = ", ".join([f"'{str(f)}'" for f in parquet_files])
+    in_range = [
+        f
+        for f in parquet_files
+        if file_in_time_range(f, work_item.time_start, work_item.time_end)
+    ]
+    files_list = ", ".join([f"'{str(f)}'" for f in in_range or parquet_files])
 
     # Build WHERE clauses
     where_clauses = []
@@ -560,26 +636,67 @@ def _convert_objectids_to_strings_polars(
     return df
 
 
+def _get_conn(memory_limit_mb: int, threads: int) -> Any:
+    """
+    Return this thread's DuckDB connection, opening it on first use.
+
+    Settings are (re)applied only when they differ from the last call on
+    this thread. The connection is closed when the worker thread exits.
+    """
+    import duckdb
+
+    settings = (memory_limit_mb, threads)
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = _tls.conn = duckdb.connect(":memory:")
+        _tls.settings = None
+
+    if _tls.settings != settings:
+        # Use per-worker memory limit (divide total by num threads calling this)
+        if memory_limit_mb:
+            conn.execute(f"SET memory_limit = '{memory_limit_mb}MB'")
+        # ThreadPoolExecutor provides parallelism; set DuckDB threads per worker
+        conn.execute(f"SET threads = {threads}")
+        _tls.settings = settings
+
+    return conn
+
+
+def _scan_partition(conn: Any, query: str) -> pa.Table:
+    """
+    Run a partition query and drain it as Arrow record batches.
+
+    The result is streamed out of DuckDB through a RecordBatchReader and
+    collected with read_all(), both of which run without holding the GIL, so
+    concurrent workers scan in parallel. Keep Python-level work out of here.
+    """
+    result = conn.execute(query)
+    # to_arrow_reader() supersedes fetch_record_batch() in newer DuckDB
+    to_reader = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+    return to_reader().read_all()
+
+
 def _execute_partition_callback(
     work_item: PartitionWorkItem,
     cache_dir: str,
-    callback: Callable[[pa.Table, Dict[str, Any]], None],
+    callback: PartitionCallback,
     schema: Any,
     time_field: str,
     any_type_strategy: Literal["float", "string", "keep_struct"],
     sort_ascending: bool,
     memory_limit_mb: int,
     threads: int = 1,
+    callback_style: CallbackStyle = "batch",
 ) -> Dict[str, Any]:
     """
     Execute callback for a single partition (runs in thread).
 
     This function:
-    1. Builds DuckDB query for the partition
-    2. Fetches data as PyArrow Table
+    1. Builds DuckDB query for the partition (thread-local connection)
+    2. Fetches data as PyArrow Table (only DuckDB/Arrow code, GIL released)
     3. Decodes Any() struct columns
     4. Converts ObjectIds to strings
-    5. Calls user callback
+    5. Calls user callback (with the Table, or its rows for "row" style)
 
     Args:
         work_item: Partition to process
@@ -591,12 +708,11 @@ def _execute_partition_callback(
         sort_ascending: Sort direction
         memory_limit_mb: DuckDB memory limit
         threads: DuckDB thread count (per worker, usually 1)
+        callback_style: "batch" passes the pa.Table, "row" a list of dicts
 
     Returns:
         Dict with rows processed and partition info
     """
-    import duckdb
-
     try:
         # Build query
         query = _build_partition_query(
@@ -606,21 +722,13 @@ def _execute_partition_callback(
             sort_ascending=sort_ascending,
         )
 
-        # Execute query
-        conn = duckdb.connect(":memory:")
-
-        # Configure DuckDB for this worker
-        # Use per-worker memory limit (divide total by num threads calling this)
-        if memory_limit_mb:
-            conn.execute(f"SET memory_limit = '{memory_limit_mb}MB'")
+        # Scan on this worker's own connection: nothing but DuckDB/Arrow work
+        # until the table is complete
+        conn = _get_conn(memory_limit_mb, threads)
+        arrow_tmp = _scan_partition(conn, query)
 
-        # ThreadPoolExecutor provides parallelism; set DuckDB threads per worker here.
-        conn.execute(f"SET threads = {threads}")
-
-        # Fetch as Arrow Table (DuckDB native support) and convert to Polars
-        arrow_tmp = conn.execute(query).fetch_arrow_table()
+        # Dispatch: Python-side wrapping, decoding and the callback
         polars_df = cast(pl.DataFrame, pl.from_arrow(arrow_tmp))
-        conn.close()
 
         if len(polars_df) == 0:
             # Empty partition - skip callback
@@ -649,8 +757,11 @@ def _execute_partition_callback(
             "total_partitions": work_item.total,
         }
 
-        # Call user callback
-        callback(arrow_table, metadata)
+        # Call user callback; only pay for row objects when asked to
+        if callback_style == "row":
+            cast(RowCallback, callback)(arrow_table.to_pylist(), metadata)
+        else:
+            cast(BatchCallback, callback)(arrow_table, metadata)
 
         return {
             "rows": arrow_table.num_rows,
@@ -666,13 +777,14 @@ def _execute_partition_callback(
 def execute_partitioned_callback(
     cache_dir: str,
     schema: Any,
-    callback: Callable[[pa.Table, Dict[str, Any]], None],
+    callback: PartitionCallback,
     partition_time_delta: timedelta,
     partition_by: Optional[List[str]],
     any_type_strategy: Literal["float", "string", "keep_struct"],
     max_workers: int,
     sort_ascending: bool,
     memory_limit_mb: int,
+    callback_style: CallbackStyle = "batch",
 ) -> Dict[str, Any]:
     """
     Orchestrate parallel callback execution for partitioned data.
@@ -689,12 +801,18 @@ def execute_partitioned_callback(
         max_workers: Number of parallel callback threads
         sort_ascending: Sort direction for time field
         memory_limit_mb: Total memory limit for DuckDB operations
+        callback_style: "batch" (pa.Table, default) or "row" (list of dicts)
 
     Returns:
         Dict with total_partitions, total_rows, skipped_partitions, duration_s
     """
     import time
 
+    if callback_style not in ("batch", "row"):
+        raise ValueError(
+            f"Unknown callback_style: {callback_style!r}. Use 'batch' or 'row'"
+        )
+
     start_time = time.time()
 
     time_field = schema.time_field
@@ -754,6 +872,7 @@ def execute_partitioned_callback(
                 sort_ascending=sort_ascending,
                 memory_limit_mb=worker_memory_mb,
                 threads=1,  # Each worker uses 1 DuckDB thread
+                callback_style=callback_style,
             ): item
             for item in work_items
         }
@@ -29,13 +29,58 @@ Usage:
 
 import hashlib
 import json
+import re
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from bson import ObjectId
 
+# Rust writer naming: ts_{min_sec}_{max_sec}_part_{counter:04}.parquet
+_TS_FILENAME_RE = re.compile(r"ts_(-?\d+)_(-?\d+)_part_(\d+)\.parquet")
+
+
+def cache_file_sort_key(path: Path) -> Tuple[int, int, int, int, str]:
+    """Order ts_{min}_{max}_part_{n} files by (min, max, n) numerically.
+
+    Plain string order breaks as soon as second counts differ in width
+    (ts_99_... after ts_100_...). Other names sort after, by name.
+    """
+    match = _TS_FILENAME_RE.fullmatch(path.name)
+    if match is None:
+        return (1, 0, 0, 0, path.name)
+    min_sec, max_sec, part = (int(group) for group in match.groups())
+    return (0, min_sec, max_sec, part, path.name)
+
+
+def _epoch_seconds(dt: datetime) -> float:
+    """Unix seconds for dt; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def file_in_time_range(
+    path: Path, start_date: Optional[datetime], end_date: Optional[datetime]
+) -> bool:
+    """Check a ts_{min}_{max} filename against [start_date, end_date).
+
+    Files without a timestamped name are always kept. The embedded seconds
+    are truncated from milliseconds, so a one-second margin is allowed on
+    both sides.
+    """
+    match = _TS_FILENAME_RE.fullmatch(path.name)
+    if match is None:
+        return True
+
+    min_sec, max_sec = int(match.group(1)), int(match.group(2))
+    if start_date is not None and max_sec + 1 < _epoch_seconds(start_date):
+        return False
+    if end_date is not None and min_sec - 1 >= _epoch_seconds(end_date):
+        return False
+    return True
+
 
 def hash_query(
     filter_dict: Dict[str, Any],
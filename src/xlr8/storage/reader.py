@@ -37,7 +37,7 @@ Used when time_field is None or documents lack timestamps
 
 STEP 2: READ & CONCATENATE
 ---------------------------
-Pandas: Read all files sequentially, concatenate into single DataFrame
+Pandas: Scan all files as one pyarrow dataset, one pandas conversion at the end
 Polars: Read all files in parallel (native multi-file support)
 
 Both engines use PyArrow under the hood for efficient Parquet parsing.
@@ -90,6 +90,9 @@ OUTPUT: DataFrame ( or Polars to stream pyarrow.Table )
 """
 
 import logging
+import queue
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Generator, Iterator, List, Literal, Optional, Tuple, Union
@@ -98,10 +101,17 @@ import duckdb
 import pandas as pd
 import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from bson import ObjectId
 
-from xlr8.constants import DEFAULT_BATCH_SIZE
+from xlr8.constants import (
+    DEFAULT_BATCH_BYTES,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PREFETCH_BATCHES,
+    MIN_AUTO_BATCH_ROWS,
+)
+from xlr8.storage.cache import cache_file_sort_key, file_in_time_range
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +150,225 @@ def _convert_datetime_for_filter(dt: datetime, target_type: pa.DataType) -> date
         return dt
 
 
+def _objectid_from_hex(value: Any) -> ObjectId:
+    """Build an ObjectId from its 24-char hex string.
+
+    Decoding the hex up front lets ObjectId take its cheap 12-byte path
+    instead of re-validating the string. Anything bytes.fromhex rejects
+    goes through the regular constructor, so errors are unchanged.
+    """
+    try:
+        return ObjectId(bytes.fromhex(value))
+    except (TypeError, ValueError):
+        return ObjectId(value)
+
+
+def _batch_rows_for_bytes(
+    parquet_file: pq.ParquetFile,
+    batch_size: int,
+    batch_bytes: int,
+    columns: Optional[List[str]] = None,
+) -> int:
+    """Pick rows per batch so a decoded batch is about batch_bytes.
+
+    Average row width comes from the row-group metadata (uncompressed bytes /
+    rows), counting only the selected columns when columns is given (a name
+    also selects its nested children, as in ParquetFile.iter_batches). The
+    result never exceeds batch_size and never drops below
+    MIN_AUTO_BATCH_ROWS unless batch_size itself is smaller.
+    """
+    metadata = parquet_file.metadata
+    if metadata.num_rows == 0:
+        return batch_size
+
+    row_groups = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
+    if columns is None:
+        total_bytes = sum(row_group.total_byte_size for row_group in row_groups)
+    else:
+        # "a" selects column path "a" and nested paths like "a.b"
+        prefixes = tuple(f"{name}." for name in columns)
+        selected = [
+            i
+            for i in range(metadata.num_columns)
+            if f"{metadata.schema.column(i).path}.".startswith(prefixes)
+        ]
+        total_bytes = sum(
+            row_group.column(i).total_uncompressed_size
+            for row_group in row_groups
+            for i in selected
+        )
+    avg_row_bytes = max(total_bytes // metadata.num_rows, 1)
+    return min(batch_size, max(MIN_AUTO_BATCH_ROWS, batch_bytes // avg_row_bytes))
+
+
+# Types.Any() struct children, in coalesce priority order per strategy
+# (mirrors _decode_struct_values_polars)
+_ANY_FLOAT_CHILDREN = ("float_value", "int64_value", "int32_value", "bool_value")
+_ANY_STRING_CHILDREN = (
+    "string_value",
+    "float_value",
+    "int64_value",
+    "int32_value",
+    "bool_value",
+    "objectid_value",
+    "decimal128_value",
+    "regex_value",
+    "binary_value",
+    "document_value",
+    "array_value",
+)
+
+
+def _decode_any_columns(
+    batch: pa.RecordBatch,
+    any_fields: List[str],
+    any_type_strategy: Literal["float", "string"],
+) -> pa.RecordBatch:
+    """Coalesce Types.Any() struct columns of batch into plain columns.
+
+    Each child is cast to the target type and combined with pc.coalesce, so
+    decoding stays columnar. Columns that are not structs are left as-is.
+    For the "string" strategy, floats are formatted by Polars ("1.0",
+    "NaN") so the output matches to_dataframe(engine="polars").
+    """
+    children: Tuple[str, ...]
+    if any_type_strategy == "string":
+        target, children = pa.string(), _ANY_STRING_CHILDREN
+    else:
+        target, children = pa.float64(), _ANY_FLOAT_CHILDREN
+
+    columns = list(batch.columns)
+    changed = False
+    for name in any_fields:
+        index = batch.schema.get_field_index(name)
+        if index < 0 or not pa.types.is_struct(columns[index].type):
+            continue
+
+        column = columns[index]
+        present = []
+        for child in children:
+            if column.type.get_field_index(child) < 0:
+                continue
+            values = pc.struct_field(column, child)
+            if child == "float_value" and any_type_strategy == "string":
+                # Arrow would give "1" where the Polars decoder gives "1.0"
+                values = pl.from_arrow(values).cast(pl.Utf8).to_arrow()
+            present.append(values.cast(target))
+        if not present:
+            logger.warning(
+                "Could not decode struct column '%s': no %s fields",
+                name,
+                any_type_strategy,
+            )
+            continue
+
+        columns[index] = present[0] if len(present) == 1 else pc.coalesce(*present)
+        changed = True
+
+    if not changed:
+        return batch
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+
+def _flatten_deep(
+    batch: pa.RecordBatch, keep: frozenset = frozenset()
+) -> pa.RecordBatch:
+    """Flatten (nested) struct columns of batch to dotted column names.
+
+    Example:
+        metadata: {'sensor_id': '...', 'device_id': '...'}
+        -> metadata.sensor_id: '...', metadata.device_id: '...'
+
+    Children are reparented rather than copied (StructArray.flatten() also
+    applies the parent's nulls). Top-level columns named in keep stay structs.
+    """
+    if not any(pa.types.is_struct(f.type) and f.name not in keep for f in batch.schema):
+        return batch
+
+    names: List[str] = []
+    arrays: List[pa.Array] = []
+    pending = [
+        (name, column, name in keep)
+        for name, column in zip(batch.schema.names, batch.columns)
+    ]
+    pending.reverse()
+    while pending:
+        name, column, kept = pending.pop()
+        if kept or not pa.types.is_struct(column.type):
+            names.append(name)
+            arrays.append(column)
+            continue
+        children = [
+            (f"{name}.{field.name}", child, False)
+            for field, child in zip(column.type, column.flatten())
+        ]
+        pending.extend(reversed(children))
+
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+@dataclass(frozen=True, slots=True)
+class _TimeFilter:
+    """Row filter on time_field for [start_date, end_date)."""
+
+    time_field: str
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+
+    def row_groups(self, parquet_file: pq.ParquetFile) -> List[int]:
+        """Row groups whose time_field statistics overlap the range.
+
+        A file without a time_field column has no rows in the range, so
+        none of its row groups are kept (to_dataframe() reads those rows as
+        null timestamps and drops them too).
+        """
+        metadata = parquet_file.metadata
+        column_index = next(
+            (
+                i
+                for i in range(metadata.num_columns)
+                if metadata.schema.column(i).path == self.time_field
+            ),
+            None,
+        )
+        if column_index is None:
+            return []
+
+        ts_type = parquet_file.schema_arrow.field(self.time_field).type
+        start = end = None
+        if self.start_date is not None:
+            start = _convert_datetime_for_filter(self.start_date, ts_type)
+        if self.end_date is not None:
+            end = _convert_datetime_for_filter(self.end_date, ts_type)
+
+        keep = []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column_index).statistics
+            if stats is not None and stats.has_min_max:
+                if start is not None and stats.max < start:
+                    continue
+                if end is not None and stats.min >= end:
+                    continue
+            keep.append(i)
+        return keep
+
+    def apply(self, data: Any) -> Any:
+        """Filter a RecordBatch or Table to rows inside the range."""
+        if self.time_field not in data.schema.names:
+            return data.slice(0, 0)
+
+        column = data.column(self.time_field)
+        mask = None
+        if self.start_date is not None:
+            start = _convert_datetime_for_filter(self.start_date, column.type)
+            mask = pc.greater_equal(column, pa.scalar(start, type=column.type))
+        if self.end_date is not None:
+            end = _convert_datetime_for_filter(self.end_date, column.type)
+            upper = pc.less(column, pa.scalar(end, type=column.type))
+            mask = upper if mask is None else pc.and_(mask, upper)
+        return data if mask is None else data.filter(mask)
+
+
 class ParquetReader:
     """
     Reads Parquet files from cache directory.
@@ -154,6 +383,10 @@ class ParquetReader:
         >>> for doc in reader.iter_documents():
         ...     logging.debug(doc)
         >>>
+        >>> # Or stream Arrow record batches
+        >>> for batch in reader.iter_batches():
+        ...     logging.debug(batch.num_rows)
+        >>>
         >>> # Or load to DataFrame
         >>> df = reader.to_dataframe()
     """
@@ -171,19 +404,255 @@ class ParquetReader:
             raise FileNotFoundError(f"Cache directory not found: {cache_dir}")
 
         # Find all parquet files (may be empty if query returned no results)
-        self.parquet_files = sorted(self.cache_dir.glob("*.parquet"))
+        self.parquet_files = sorted(
+            self.cache_dir.glob("*.parquet"), key=cache_file_sort_key
+        )
+
+        # Parsed footers, filled on first open and reused by later scans
+        self._metadata: Dict[Path, pq.FileMetaData] = {}
+
+    def _file_metadata(self, path: Path) -> pq.FileMetaData:
+        """Return the parsed parquet footer for path (cached per reader)."""
+        metadata = self._metadata.get(path)
+        if metadata is None:
+            metadata = self._metadata[path] = pq.read_metadata(path)
+        return metadata
+
+    def _open_parquet(self, path: Path) -> pq.ParquetFile:
+        """Open a cache file memory-mapped, reusing its cached footer.
+
+        mmap + pre-buffering coalesces page reads; passing the cached
+        metadata skips re-parsing the Thrift footer on repeated scans.
+        """
+        return pq.ParquetFile(
+            path,
+            metadata=self._file_metadata(path),
+            memory_map=True,
+            pre_buffer=True,
+        )
+
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        prefetch_batches: int = DEFAULT_PREFETCH_BATCHES,
+        time_field: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        schema: Optional[Any] = None,
+        any_type_strategy: Literal["float", "string", "keep_struct"] = "float",
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream Arrow record batches from all parquet files.
+
+        Columnar counterpart of iter_documents() for batch-native consumers
+        (DuckDB, Polars, Arrow compute); no per-row Python objects are built.
+        With prefetch_batches > 0, batches are decoded in a background thread
+        (PyArrow releases the GIL) while earlier ones are consumed; at most
+        prefetch_batches decoded batches wait in memory. Row order is
+        unchanged.
+
+        With time_field and start_date/end_date, files whose ts_{min}_{max}
+        name lies outside the range are never opened, row groups are skipped
+        using their min/max statistics, and remaining rows are filtered.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+            batch_bytes: Target decoded size per batch; wide rows get
+                fewer rows per batch (never more than batch_size)
+            prefetch_batches: Batches to decode ahead in a background thread
+                (0 = decode in the caller's thread)
+            time_field: Name of time field for date filtering
+            start_date: Keep rows from this date (inclusive)
+            end_date: Keep rows until this date (exclusive)
+            schema: Optional schema; Types.Any() struct columns are decoded
+                with Arrow compute kernels (no per-row Python) and nested
+                structs are flattened to dotted names, as in to_dataframe()
+            any_type_strategy: How to decode Types.Any() struct columns:
+                - "float": Coalesce to float64, prioritize numeric (default)
+                - "string": Convert everything to string (lossless)
+                - "keep_struct": Keep raw struct, don't decode
+            columns: Only read these columns (None = all). Dotted names
+                select struct children ("metadata.device_id"); columns are
+                returned in file order. The time field is read for
+                filtering when needed but not returned unless listed.
+
+        Yields:
+            pa.RecordBatch objects, as stored in the cache files (plus
+            Any-column decoding when a schema is given)
+
+        Example:
+            >>> for batch in reader.iter_batches():
+            ...     con.execute("INSERT INTO t SELECT * FROM batch")
+        """
+        files = self.parquet_files
+        time_filter = None
+        if time_field and (start_date or end_date):
+            time_filter = _TimeFilter(time_field, start_date, end_date)
+            files = [f for f in files if file_in_time_range(f, start_date, end_date)]
+
+        read_columns = columns
+        if (
+            columns is not None
+            and time_filter
+            and time_filter.time_field not in columns
+        ):
+            read_columns = [*columns, time_filter.time_field]
+
+        batches = self._iter_file_batches(
+            files, batch_size, batch_bytes, prefetch_batches, time_filter, read_columns
+        )
+        if read_columns is not columns:
+            # Time field was only needed to filter rows
+            batches = (
+                batch.select([n for n in batch.schema.names if n != time_field])
+                for batch in batches
+            )
+
+        if schema is None:
+            yield from batches
+            return
+
+        any_fields = [
+            name
+            for name, field_type in getattr(schema, "fields", {}).items()
+            if self._is_any_type(field_type)
+        ]
+        keep_struct = any_type_strategy == "keep_struct"
+        keep = frozenset(any_fields) if keep_struct else frozenset()
+
+        for batch in batches:
+            if any_fields and any_type_strategy != "keep_struct":
+                batch = _decode_any_columns(batch, any_fields, any_type_strategy)
+            yield _flatten_deep(batch, keep)
+
+    def _iter_file_batches(
+        self,
+        files: List[Path],
+        batch_size: int,
+        batch_bytes: int,
+        prefetch_batches: int,
+        time_filter: Optional[_TimeFilter],
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Raw (undecoded) batches from files, sequential or prefetched."""
+        if prefetch_batches > 0:
+            yield from self._iter_batches_prefetched(
+                files, batch_size, batch_bytes, prefetch_batches, time_filter, columns
+            )
+            return
+
+        for parquet_file in files:
+            parquet_file_obj = self._open_parquet(parquet_file)
+            rows = _batch_rows_for_bytes(
+                parquet_file_obj, batch_size, batch_bytes, columns
+            )
+            if time_filter is None:
+                yield from parquet_file_obj.iter_batches(
+                    batch_size=rows, columns=columns
+                )
+                continue
+
+            row_groups = time_filter.row_groups(parquet_file_obj)
+            for batch in parquet_file_obj.iter_batches(
+                batch_size=rows, row_groups=row_groups, columns=columns
+            ):
+                batch = time_filter.apply(batch)
+                if batch.num_rows:
+                    yield batch
+
+    def _iter_batches_prefetched(
+        self,
+        files: List[Path],
+        batch_size: int,
+        batch_bytes: int,
+        prefetch_batches: int,
+        time_filter: Optional[_TimeFilter],
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """_iter_file_batches() with decoding moved to a background thread.
+
+        The thread streams batches file by file into a queue holding at most
+        prefetch_batches entries, so decoding overlaps with consumption
+        (PyArrow releases the GIL) while memory stays bounded by a few batches.
+        """
+        batches: queue.Queue[Any] = queue.Queue(maxsize=prefetch_batches)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            # Give up once the consumer has stopped, instead of blocking forever
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in self._iter_file_batches(
+                    files, batch_size, batch_bytes, 0, time_filter, columns
+                ):
+                    if not put(batch):
+                        return
+            except Exception as e:  # noqa: BLE001 - re-raised in the consumer
+                put(e)
+                return
+            put(done)
+
+        thread = threading.Thread(target=produce, name="xlr8-prefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Consumer may stop early; let the producer exit before returning
+            stop.set()
+            thread.join()
 
     def iter_documents(
         self,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        prefetch_batches: int = DEFAULT_PREFETCH_BATCHES,
+        time_field: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        schema: Optional[Any] = None,
+        any_type_strategy: Literal["float", "string", "keep_struct"] = "float",
+        columns: Optional[List[str]] = None,
+        reuse_dict: bool = False,
     ) -> Iterator[Dict[str, Any]]:
         """
         Stream documents from all parquet files.
 
-        Reads in batches to avoid loading entire dataset into memory.
+        Reads in batches (see iter_batches()) to avoid loading entire dataset
+        into memory, converting each batch straight to dicts.
 
         Args:
-            batch_size: Number of rows to read per batch
+            batch_size: Maximum number of rows to read per batch
+            batch_bytes: Target decoded size per batch; wide rows get
+                fewer rows per batch (never more than batch_size)
+            prefetch_batches: Batches to decode ahead in a background thread
+                (0 = decode in the caller's thread)
+            time_field: Name of time field for date filtering
+            start_date: Keep documents from this date (inclusive)
+            end_date: Keep documents until this date (exclusive)
+            schema: Optional schema for Types.Any() decoding (see iter_batches)
+            any_type_strategy: How to decode Types.Any() struct columns
+            columns: Only read these columns (None = all, see iter_batches)
+            reuse_dict: Yield the same dict object for every row, updated in
+                place (less allocation for consumers that use each document
+                immediately). The dict is overwritten on the next iteration:
+                copy it (dict(doc)) to keep it, and do not modify it.
 
         Yields:
             Document dictionaries
@@ -192,16 +661,36 @@ class ParquetReader:
             >>> for doc in reader.iter_documents(batch_size=5000):
             ...     process(doc)
         """
-        for parquet_file in self.parquet_files:
-            # Read in batches
-            parquet_file_obj = pq.ParquetFile(parquet_file)
-
-            for batch in parquet_file_obj.iter_batches(batch_size=batch_size):
-                # Convert Arrow batch to pandas then to dicts
-                df_batch = batch.to_pandas()
+        batches = self.iter_batches(
+            batch_size,
+            batch_bytes,
+            prefetch_batches,
+            time_field=time_field,
+            start_date=start_date,
+            end_date=end_date,
+            schema=schema,
+            any_type_strategy=any_type_strategy,
+            columns=columns,
+        )
+        if not reuse_dict:
+            for batch in batches:
+                # Convert Arrow batch straight to dicts (no pandas round-trip)
+                yield from batch.to_pylist()
+            return
 
-                for _, row in df_batch.iterrows():
-                    yield row.to_dict()
+        row: Dict[str, Any] = {}
+        for batch in batches:
+            names = batch.schema.names
+            # Every row sets the same keys, so only clear between batches
+            row.clear()
+            if batch.num_columns == 0:
+                # zip() of no columns stops at once; rows are still there
+                for _ in range(batch.num_rows):
+                    yield row
+                continue
+            for values in zip(*(column.to_pylist() for column in batch.columns)):
+                row.update(zip(names, values))
+                yield row
 
     def _is_any_type(self, field_type: Any) -> bool:
         """Check if field_type is an Any type (supports both class and instance)."""
@@ -347,26 +836,28 @@ class ParquetReader:
                         if isinstance(nested_type, ObjectIdType):
                             objectid_fields.append(f"{field_name}.{nested_name}")
 
-        # Convert string columns back to ObjectId
+        # Convert string columns back to ObjectId (nulls and "" pass through)
         for field in objectid_fields:
             if field in df.columns:
-                df[field] = df[field].apply(
-                    lambda x: ObjectId(x) if x and pd.notna(x) else x
+                df[field] = df[field].map(
+                    lambda x: _objectid_from_hex(x) if x else x, na_action="ignore"
                 )
 
         return df
 
     def _decode_struct_values_polars(
         self,
-        df: "pl.DataFrame",
+        df: Union["pl.DataFrame", "pl.LazyFrame"],
         schema: Any,
         any_type_strategy: Literal["float", "string", "keep_struct"] = "float",
-    ) -> "pl.DataFrame":
+    ) -> Union["pl.DataFrame", "pl.LazyFrame"]:
         """
         Decode struct-encoded Any-typed columns back to actual values (Polars).
 
+        Works on a LazyFrame too, so decoding becomes part of the scan plan.
+
         Args:
-            df: Polars DataFrame
+            df: Polars DataFrame or LazyFrame
             schema: Schema with field type info
             any_type_strategy: How to decode:
                 - "float": Coalesce to Float64, prioritize numeric (default)
@@ -376,11 +867,14 @@ class ParquetReader:
         if not hasattr(schema, "fields"):
             return df
 
+        # LazyFrame schemas are resolved once from the parquet footers
+        df_schema = df.collect_schema()
+
         # Find Any-typed fields in schema
         for field_name, field_type in schema.fields.items():
-            if self._is_any_type(field_type) and field_name in df.columns:
+            if self._is_any_type(field_type) and field_name in df_schema:
                 # Check if column is a struct
-                col_dtype = df.schema[field_name]
+                col_dtype = df_schema[field_name]
                 if str(col_dtype).startswith("Struct"):
                     # Strategy: keep_struct - don't decode at all
                     if any_type_strategy == "keep_struct":
@@ -649,6 +1143,13 @@ class ParquetReader:
                     end_converted = _convert_datetime_for_filter(end_date, ts_type)
                     lf = lf.filter(pl.col(time_field) < end_converted)
 
+            # Decode Any() structs inside the lazy plan, so Polars runs it
+            # with the scan (multi-file parallel read, pushdown) in one pass
+            if schema is not None:
+                lf = self._decode_struct_values_polars(  # type: ignore[assignment]
+                    lf, schema, any_type_strategy
+                )
+
             # Collect executes the query with predicate pushdown
             df = lf.collect()
 
@@ -661,26 +1162,34 @@ class ParquetReader:
             if not self.parquet_files:
                 return pd.DataFrame()
 
-            # Read all files with optional filter (predicate pushdown)
-            # Use PyArrow to read, then convert to pandas - this allows
-            # struct columns to stay in Arrow format for fast Rust decoding
-            tables = []
-            for parquet_file in self.parquet_files:
-                try:
-                    # Use PyArrow filters for efficient predicate pushdown
-                    table = pq.read_table(parquet_file, filters=filters)
-                    tables.append(table)
-                except Exception as e:
-                    if coerce == "error":
-                        logger.error(f"Error reading {parquet_file}: {e}")
-                        continue
-                    raise
-
-            if not tables:
+            files = self.parquet_files
+            if filters:
+                files = [
+                    f for f in files if file_in_time_range(f, start_date, end_date)
+                ]
+            if not files:
                 return pd.DataFrame()
 
-            # Concatenate Arrow tables
-            combined_table = pa.concat_tables(tables)
+            # Scan all files as one dataset with optional filter (predicate
+            # pushdown) into a single Arrow table - struct columns stay in
+            # Arrow format for fast Rust decoding
+            try:
+                combined_table = self._read_dataset(files, filters)
+            except (pa.ArrowException, OSError) as e:
+                if coerce != "error":
+                    raise
+                # Retry file by file so unreadable files can be skipped
+                logger.error(f"Error reading cache as a dataset: {e}")
+                tables = []
+                for parquet_file in files:
+                    try:
+                        tables.append(pq.read_table(parquet_file, filters=filters))
+                    except Exception as e:
+                        logger.error(f"Error reading {parquet_file}: {e}")
+                if not tables:
+                    return pd.DataFrame()
+                combined_table = pa.concat_tables(tables)
+                del tables
 
             # FAST PATH: Decode Any-typed struct columns directly in Arrow
             # This gives us 44x speedup because Rust reads Arrow memory directly
@@ -710,19 +1219,48 @@ class ParquetReader:
             if columns_to_drop:
                 combined_table = combined_table.drop(columns_to_drop)
 
-            # Convert to pandas (non-Any columns go through normal path)
-            df = combined_table.to_pandas()
+            # Convert to pandas (non-Any columns go through normal path).
+            # self_destruct frees each Arrow column as soon as it is converted,
+            # so peak memory stays near one copy of the data instead of two.
+            # combined_table must not be used after this call.
+            df = combined_table.to_pandas(self_destruct=True)
+            del combined_table
 
             # Add back Any columns with decoded values
-            # (bypassing struct->dict->decode path)
-            for field_name, decoded_values in any_columns_decoded.items():
-                df[field_name] = decoded_values
+            # (bypassing struct->dict->decode path) in one concat, since
+            # inserting them one by one fragments the frame
+            if any_columns_decoded:
+                decoded_df = pd.DataFrame(any_columns_decoded, index=df.index)
+                df = pd.concat([df, decoded_df], axis=1)
 
             return self._process_dataframe(df, engine, schema, coerce)
 
         else:
             raise ValueError(f"Unknown engine: {engine}. Use 'pandas' or 'polars'")
 
+    def _read_dataset(
+        self, files: List[Path], filters: Optional[List[Tuple[str, str, Any]]]
+    ) -> pa.Table:
+        """Read files as one pyarrow dataset into a single table.
+
+        The dataset factory inspects every file's schema in one native pass
+        and unifies them, so a column missing from some files comes back as
+        nulls rather than being dropped; incompatible types still raise.
+        """
+        import pyarrow.dataset as ds
+        import pyarrow.fs as pafs
+
+        factory = ds.FileSystemDatasetFactory(
+            pafs.LocalFileSystem(),
+            [str(f) for f in files],
+            ds.ParquetFileFormat(),
+            ds.FileSystemFactoryOptions(),
+        )
+        # fragments=None inspects all files, not just the first one
+        dataset = factory.finish(factory.inspect(fragments=None))
+        expression = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(filter=expression)
+
     def iter_dataframe_batches(
         self,
         batch_size: int = 10000,
@@ -780,7 +1318,7 @@ class ParquetReader:
         for parquet_file in self.parquet_files:
             try:
                 # Open parquet file for batch iteration
-                parquet_file_obj = pq.ParquetFile(parquet_file)
+                parquet_file_obj = self._open_parquet(parquet_file)
 
                 for batch in parquet_file_obj.iter_batches(batch_size=batch_size):
                     # Convert Arrow batch to pandas
@@ -1341,7 +1879,7 @@ class ParquetReader:
             total_size += parquet_file.stat().st_size
 
             # Read metadata
-            parquet_meta = pq.read_metadata(parquet_file)
+            parquet_meta = self._file_metadata(parquet_file)
             total_rows += parquet_meta.num_rows
 
             # Get schema from first file
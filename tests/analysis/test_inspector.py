@@ -25,8 +25,10 @@ from xlr8.analysis.inspector import (
     ChunkabilityMode,
     ChunkabilityResult,
     _or_depth,
+    _query_shape,
     _references_field,
     has_natural_sort,
+    has_unknown_operators,
     is_chunkable_query,
     split_global_and,
     validate_query_for_chunking,
@@ -945,6 +947,55 @@ class TestHelperFunctions:
         assert _or_depth({"$or": [{"$or": [{}]}]}) == 2
         assert _or_depth({"$and": [{"$or": [{}]}]}) == 1
 
+    def test_or_depth_deeply_nested(self):
+        """_or_depth handles nesting beyond the recursion limit."""
+        query: dict = {"a": 1}
+        for _ in range(5000):
+            query = {"$or": [query]}
+        assert _or_depth(query) == 5000
+
+    @pytest.mark.parametrize(
+        "operator, expected",
+        [("$or", (False, "nested $or (depth 5000 > 1)")), ("$and", (True, ""))],
+    )
+    def test_validation_deeply_nested(self, time_field, operator, expected):
+        """validate_query_for_chunking handles nesting beyond the recursion limit."""
+        query: dict = {"$nor": [{"a": 1}]}
+        for _ in range(5000):
+            query = {operator: [query]}
+        assert validate_query_for_chunking(query, time_field) == expected
+        assert has_unknown_operators(query) == (False, None)
+
+    def test_query_shape_ignores_values(self):
+        """Queries differing only in scalar values share a shape."""
+        q1 = {"a": 1, "ts": {"$gte": 1, "$lt": 2}, "b": {"$in": [1, 2, 3]}}
+        q2 = {"a": "x", "ts": {"$gte": 5, "$lt": 9}, "b": {"$in": [4]}}
+        assert _query_shape(q1) == _query_shape(q2)
+        assert _query_shape({"$or": []}) != _query_shape({"$or": [1]})
+        assert _query_shape({"a": {"$not": 1}}) != _query_shape({"ts": {"$not": 1}})
+
+    def test_validation_cache_keyed_by_shape(self, time_field):
+        """Cached verdicts do not leak across shapes or time fields."""
+        query = {"ts": {"$not": {"$lt": 1}}}
+        assert validate_query_for_chunking(query, "other")[0]
+        assert not validate_query_for_chunking(query, "ts")[0]
+        assert not validate_query_for_chunking({"$or": []}, time_field)[0]
+        assert validate_query_for_chunking({"$or": [{"a": 1}]}, time_field)[0]
+
+    def test_validation_cache_concurrent_eviction(self, time_field):
+        """Threads evicting from a full cache at once do not raise."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        queries = [{f"f{i}": 1, time_field: {"$gte": 1}} for i in range(2000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda q: validate_query_for_chunking(q, time_field), queries
+                )
+            )
+
+        assert len(results) == len(queries)
+
     def test_references_field(self):
         """Verify _references_field works correctly."""
         assert _references_field({"a": 1}, "a")
@@ -0,0 +1,171 @@
+"""
+Tests for xlr8.execution.callback module.
+
+Covers:
+- Partition plan start from Parquet statistics (with scan fallback)
+- Thread-local DuckDB connections for Phase-2 workers
+- Partition queries reading only files in the partition's time range
+- execute_partitioned_callback payload styles ("batch" and "row")
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from xlr8.execution.callback import (
+    PartitionWorkItem,
+    _build_partition_plan,
+    _build_partition_query,
+    _get_conn,
+    _min_time_from_statistics,
+    execute_partitioned_callback,
+)
+from xlr8.schema import Schema
+from xlr8.schema.types import Float, Timestamp
+
+
+@pytest.fixture
+def partition_cache(tmp_path):
+    """Cache dir with two days of data (one partition per day)."""
+    times = [
+        datetime(2024, 1, 1, 6, tzinfo=timezone.utc),
+        datetime(2024, 1, 1, 18, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 6, tzinfo=timezone.utc),
+    ]
+    table = pa.table(
+        {
+            "timestamp": pa.array(times, type=pa.timestamp("ms", tz="UTC")),
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+    pq.write_table(table, tmp_path / "part_0000.parquet")
+    return tmp_path
+
+
+@pytest.fixture
+def schema():
+    return Schema(
+        time_field="timestamp",
+        fields={"timestamp": Timestamp(unit="ms", tz="UTC"), "value": Float()},
+    )
+
+
+def _run(cache_dir, schema, callback_style):
+    payloads = []
+    result = execute_partitioned_callback(
+        cache_dir=str(cache_dir),
+        schema=schema,
+        callback=lambda data, metadata: payloads.append(data),
+        partition_time_delta=timedelta(days=1),
+        partition_by=None,
+        any_type_strategy="float",
+        max_workers=1,
+        sort_ascending=True,
+        memory_limit_mb=128,
+        callback_style=callback_style,
+    )
+    return result, payloads
+
+
+class TestPartitionPlan:
+    """Test partition plan discovery."""
+
+    @pytest.mark.parametrize("write_statistics", [True, False])
+    def test_plan_starts_at_day_of_min_time(self, tmp_path, write_statistics):
+        """Footer statistics (or the scan fallback) give a day-floored start."""
+        times = [
+            datetime(2024, 1, 2, 6, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 18, tzinfo=timezone.utc),
+        ]
+        table = pa.table(
+            {"timestamp": pa.array(times, type=pa.timestamp("ms", tz="UTC"))}
+        )
+        pq.write_table(
+            table, tmp_path / "part_0000.parquet", write_statistics=write_statistics
+        )
+
+        stats_min = _min_time_from_statistics(
+            list(tmp_path.glob("*.parquet")), "timestamp"
+        )
+        items = _build_partition_plan(
+            cache_dir=str(tmp_path),
+            time_field="timestamp",
+            partition_time_delta=timedelta(days=1),
+            partition_by=None,
+            memory_limit_mb=128,
+            threads=1,
+        )
+
+        assert stats_min == (times[1] if write_statistics else None)
+        assert [item.time_start for item in items] == [
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
+        ]
+
+
+class TestPartitionQuery:
+    """Test per-partition DuckDB queries."""
+
+    def test_reads_only_files_overlapping_partition(self, tmp_path):
+        """ts_{min}_{max} files outside the time bucket are not scanned."""
+        for day in (1, 2):
+            lo = int(datetime(2024, 1, day, tzinfo=timezone.utc).timestamp())
+            (tmp_path / f"ts_{lo}_{lo + 3600}_part_0000.parquet").touch()
+        work_item = PartitionWorkItem(
+            index=0,
+            total=1,
+            time_start=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            time_end=datetime(2024, 1, 3, tzinfo=timezone.utc),
+            partition_values=None,
+            partition_fields=None,
+        )
+
+        query = _build_partition_query(str(tmp_path), "timestamp", work_item)
+
+        assert "ts_1704153600_" in query
+        assert "ts_1704067200_" not in query
+
+
+class TestWorkerConnections:
+    """Test per-thread DuckDB connections."""
+
+    def test_connection_reused_per_thread_not_shared(self):
+        """Each thread opens one connection and keeps reusing it."""
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            ThreadPoolExecutor(max_workers=1) as other_executor,
+        ):
+            first = executor.submit(_get_conn, 64, 1).result()
+            again = executor.submit(_get_conn, 64, 1).result()
+            other = other_executor.submit(_get_conn, 64, 1).result()
+
+        assert first is again
+        assert other is not first
+
+
+class TestCallbackStyle:
+    """Test what the user callback receives per partition."""
+
+    def test_batch_style_passes_arrow_tables(self, partition_cache, schema):
+        """Default "batch" style hands each partition over as a pa.Table."""
+        result, payloads = _run(partition_cache, schema, "batch")
+
+        assert result["total_rows"] == 3
+        assert all(isinstance(p, pa.Table) for p in payloads)
+        assert sorted(p.num_rows for p in payloads) == [1, 2]
+
+    def test_row_style_passes_dicts(self, partition_cache, schema):
+        """Row style hands over the same partitions as lists of dicts."""
+        _, payloads = _run(partition_cache, schema, "row")
+
+        values = sorted(row["value"] for rows in payloads for row in rows)
+        assert all(isinstance(rows, list) for rows in payloads)
+        assert values == [1.0, 2.0, 3.0]
+
+    def test_unknown_style_raises(self, partition_cache, schema):
+        """A misspelled style is rejected instead of falling back to batch."""
+        with pytest.raises(ValueError, match="callback_style"):
+            _run(partition_cache, schema, "rows")
@@ -366,6 +366,24 @@ class TestBoundaryOperatorChunkConstruction:
         # Lower bound always $gte for chunk continuity
         assert "$gte" in time_clause
 
+    def test_sub_day_chunks_start_at_query_start(self):
+        """Sub-day chunk sizes must not emit chunks before the query start."""
+        from xlr8.analysis.chunker import chunk_time_range
+
+        t1 = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        t2 = datetime(2024, 1, 1, 15, 0, tzinfo=timezone.utc)
+
+        chunks = chunk_time_range(start=t1, end=t2, chunk_size=timedelta(hours=1))
+
+        assert chunks == [
+            (t1, datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc)),
+            (
+                datetime(2024, 1, 1, 13, 0, tzinfo=timezone.utc),
+                datetime(2024, 1, 1, 14, 0, tzinfo=timezone.utc),
+            ),
+            (datetime(2024, 1, 1, 14, 0, tzinfo=timezone.utc), t2),
+        ]
+
 
 class TestBoundaryDataValidation:
     """
@@ -0,0 +1 @@
+"""Tests for repository scripts."""
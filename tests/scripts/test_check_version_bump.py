@@ -0,0 +1,185 @@
+"""
+Tests for scripts/check_version_bump.py.
+
+Covers:
+- Staged file detection with both backends (pygit2 and git CLI)
+- `git commit -a` (temporary index via GIT_INDEX_FILE)
+- Reading `[project].version` from pyproject.toml
+- Version ordering (a < b < rc < release, numeric pre-release numbers)
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "check_version_bump.py"
+
+_spec = importlib.util.spec_from_file_location("check_version_bump", SCRIPT)
+assert _spec is not None and _spec.loader is not None
+check_version_bump = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_version_bump)
+
+
+def _git(repo: Path, *args: str, **kwargs) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Repo with one commit that is also origin/main (version 1.0.0)."""
+    monkeypatch.delenv("GIT_INDEX_FILE", raising=False)
+    (tmp_path / "src" / "xlr8").mkdir(parents=True)
+    (tmp_path / "src" / "xlr8" / "m.py").write_text("x = 1\n")
+    (tmp_path / "pyproject.toml").write_text('[project]\nversion = "1.0.0"\n')
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+    _git(tmp_path, "update-ref", "refs/remotes/origin/main", "HEAD")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(params=["cli", "pygit2"])
+def backend(request):
+    """Repository handle for the backend under test (None = git CLI)."""
+    if request.param == "cli":
+        return lambda: None
+    pytest.importorskip("pygit2")
+    return check_version_bump.open_repo
+
+
+class TestStagedFiles:
+    """Test staged_files() on both backends."""
+
+    def test_reads_temporary_index(self, repo, backend, monkeypatch):
+        """Changes staged only in GIT_INDEX_FILE (as by commit -a) are seen."""
+        (repo / "src" / "xlr8" / "m.py").write_text("x = 2\n")
+        env = {**os.environ, "GIT_INDEX_FILE": str(repo / "tmp-index")}
+        _git(repo, "read-tree", "HEAD", env=env)
+        _git(repo, "add", "-u", env=env)
+        monkeypatch.setenv("GIT_INDEX_FILE", env["GIT_INDEX_FILE"])
+
+        assert check_version_bump.staged_files(backend()) == ["src/xlr8/m.py"]
+
+    def test_includes_deletions(self, repo, backend):
+        """Deleting a package module counts as a package change."""
+        _git(repo, "rm", "-q", "src/xlr8/m.py")
+
+        files = check_version_bump.staged_files(backend())
+
+        assert files == ["src/xlr8/m.py"]
+        assert check_version_bump.classify(files) == (True, False)
+
+
+class TestVersionFromPyproject:
+    """Test version_from_pyproject() table scanning."""
+
+    def test_project_table_after_other_tables(self):
+        """[project] does not have to be the first table."""
+        raw = b'[build-system]\nrequires = ["maturin"]\n[project]\nversion = "1.2.3"\n'
+
+        assert check_version_bump.version_from_pyproject(raw) == "1.2.3"
+
+    def test_ignores_version_in_later_table(self):
+        """A version key after [project] ends belongs to another table."""
+        raw = b'[project]\nname = "xlr8"\n\n[tool.other]\nversion = "9.9.9"\n'
+
+        with pytest.raises(KeyError, match="version"):
+            check_version_bump.version_from_pyproject(raw)
+
+    def test_ignores_version_in_earlier_table(self):
+        """Only the [project] table's own version is returned."""
+        raw = b'[tool.other]\nversion = "9.9.9"\n[project]\nversion = "1.0.0"\n'
+
+        assert check_version_bump.version_from_pyproject(raw) == "1.0.0"
+
+    @pytest.mark.parametrize(
+        "raw, key",
+        [
+            (b'[tool.other]\nversion = "1.0.0"\n', "project"),
+            (b'[project]\nname = "xlr8"\ndynamic = ["version"]\n', "version"),
+        ],
+    )
+    def test_missing_version_raises_key_error(self, raw, key):
+        """No [project] table or no version in it raises KeyError."""
+        with pytest.raises(KeyError, match=key):
+            check_version_bump.version_from_pyproject(raw)
+
+    def test_single_quoted_version(self):
+        """TOML literal strings ('...') are read like basic strings."""
+        raw = b"[project]  # package metadata\nversion = '0.1.4b2'\n"
+
+        assert check_version_bump.version_from_pyproject(raw) == "0.1.4b2"
+
+
+class TestVersionOrdering:
+    """Test parse_version() / is_version_greater_than() ordering."""
+
+    # Ascending release order
+    VERSIONS = [
+        "0.9.9",
+        "1.0.0a1",
+        "1.0.0a2",
+        "1.0.0b1",
+        "1.0.0rc2",
+        "1.0.0rc10",
+        "1.0.0",
+        "v1.0.1",
+        "1.1.0",
+        "1.10.0",
+        "2.0.0",
+    ]
+
+    def test_sorts_in_release_order(self):
+        """Pre-releases sort a < b < rc < release, numbers numerically."""
+        shuffled = self.VERSIONS[::2] + self.VERSIONS[1::2]
+
+        ordered = sorted(shuffled, key=check_version_bump.parse_version)
+
+        assert ordered == self.VERSIONS
+
+    def test_greater_than_is_strict(self):
+        """Equal versions are not a bump; any later version is."""
+        for lower, higher in zip(self.VERSIONS, self.VERSIONS[1:]):
+            assert check_version_bump.is_version_greater_than(higher, lower)
+            assert not check_version_bump.is_version_greater_than(lower, higher)
+        assert not check_version_bump.is_version_greater_than("1.0.0", "v1.0.0")
+
+    @pytest.mark.parametrize("version", ["1.0.0dev1", "1.0.0rc", "1.0", "1.0.0.post1"])
+    def test_unsupported_version_raises(self, version):
+        """Unknown suffixes and shapes raise instead of comparing arbitrarily."""
+        with pytest.raises(ValueError, match="Unsupported version"):
+            check_version_bump.parse_version(version)
+
+
+def test_unsupported_version_is_reported(repo, capsys):
+    """main() reports an unparseable version via fail(), not a traceback."""
+    (repo / "pyproject.toml").write_text('[project]\nversion = "1.0.1dev1"\n')
+    (repo / "src" / "xlr8" / "m.py").write_text("x = 2\n")
+    _git(repo, "add", ".")
+
+    assert check_version_bump.main() == 1
+    assert "Unsupported version: '1.0.1dev1'" in capsys.readouterr().err
+
+
+def test_commit_all_without_bump_is_rejected(repo):
+    """The hook rejects `git commit -a` of package code without a bump."""
+    hook = repo / ".git" / "hooks" / "pre-commit"
+    hook.write_text(f"#!/bin/sh\nexec {sys.executable} {SCRIPT}\n")
+    hook.chmod(0o755)
+    (repo / "src" / "xlr8" / "m.py").write_text("x = 2\n")
+
+    result = _git(repo, "commit", "-a", "-qm", "change")
+
+    assert result.returncode != 0
+    assert "version bump required" in result.stderr
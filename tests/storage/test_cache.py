@@ -4,11 +4,12 @@ Tests for cache.py module.
 Cache correctness is critical for avoiding redundant MongoDB queries.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 
 from bson import ObjectId
 
-from xlr8.storage.cache import CacheManager, hash_query
+from xlr8.storage.cache import CacheManager, file_in_time_range, hash_query
 
 
 class TestHashQuery:
@@ -276,3 +277,29 @@ class TestCacheLifecycle:
 
         assert cache2.exists()
         assert len(cache2.list_parquet_files()) == 1
+
+
+class TestFileInTimeRange:
+    """Test filename-based pruning of ts_{min}_{max}_part_{n} files."""
+
+    # 2024-01-01 00:00 to 01:00 UTC
+    PATH = Path("ts_1704067200_1704070800_part_0000.parquet")
+
+    def test_overlapping_range_kept(self):
+        """Files overlapping [start, end) are kept; open bounds match anything."""
+        start = datetime(2024, 1, 1, 0, 30)
+        assert file_in_time_range(self.PATH, start, None)
+        assert file_in_time_range(self.PATH, None, start)
+        assert file_in_time_range(self.PATH, None, None)
+
+    def test_disjoint_range_skipped(self):
+        """Files entirely before start or at/after end are skipped."""
+        assert not file_in_time_range(self.PATH, datetime(2024, 1, 1, 2), None)
+        assert not file_in_time_range(
+            self.PATH, None, datetime(2023, 12, 31, 23, tzinfo=timezone.utc)
+        )
+
+    def test_untimestamped_name_kept(self):
+        """Files without a ts_ name cannot be pruned."""
+        path = Path("part_0000.parquet")
+        assert file_in_time_range(path, datetime(2030, 1, 1), datetime(2031, 1, 1))
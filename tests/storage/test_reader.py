@@ -4,6 +4,7 @@ Tests for xlr8.storage.reader module.
 Covers:
 - ParquetReader initialization
 - iter_documents() streaming
+- iter_batches() Arrow streaming
 - to_dataframe() loading with pandas
 - Statistics and metadata
 """
@@ -57,6 +58,17 @@ def sample_parquet_cache(tmp_path, simple_schema):
     return cache_dir
 
 
+@pytest.fixture
+def multi_file_cache(tmp_path):
+    """Five small files of three rows each: {"part": <file>, "row": 0..2}."""
+    cache_dir = tmp_path / "multi_cache"
+    cache_dir.mkdir()
+    for part in range(5):
+        df = pd.DataFrame({"part": [part] * 3, "row": [0, 1, 2]})
+        df.to_parquet(cache_dir / f"ts_part_{part:04d}.parquet", index=False)
+    return cache_dir
+
+
 class TestParquetReaderInit:
     """Test ParquetReader initialization."""
 
@@ -76,6 +88,26 @@ class TestParquetReaderInit:
 
         assert len(reader.parquet_files) == 0
 
+    def test_orders_timestamped_files_numerically(self, tmp_path):
+        """ts_{min}_{max}_part_{n} files sort by time, not by string."""
+        names = [
+            "ts_100_200_part_0000.parquet",
+            "ts_99_150_part_0001.parquet",
+            "ts_99_150_part_0000.parquet",
+            "part_0000.parquet",
+        ]
+        for name in names:
+            (tmp_path / name).touch()
+
+        reader = ParquetReader(cache_dir=tmp_path)
+
+        assert [f.name for f in reader.parquet_files] == [
+            "ts_99_150_part_0000.parquet",
+            "ts_99_150_part_0001.parquet",
+            "ts_100_200_part_0000.parquet",
+            "part_0000.parquet",
+        ]
+
     def test_raises_error_for_missing_directory(self, tmp_path):
         """Reader should raise error for non-existent directory."""
         missing_dir = tmp_path / "missing"
@@ -115,6 +147,317 @@ class TestIterDocuments:
 
         assert doc_count == 3
 
+    def test_yields_native_python_values(self, sample_parquet_cache):
+        """iter_documents() should yield plain Python values per document."""
+        reader = ParquetReader(cache_dir=sample_parquet_cache)
+
+        doc = next(reader.iter_documents())
+
+        assert isinstance(doc["timestamp"], datetime)
+        assert doc["timestamp"] == datetime(2024, 1, 15, tzinfo=timezone.utc)
+        assert type(doc["value"]) is float
+        assert doc["value"] == 42.5
+        assert doc["name"] == "test1"
+
+    def test_batch_rows_follow_row_width(self, tmp_path):
+        """Wide rows should get fewer rows per batch than narrow rows."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from xlr8.storage.reader import _batch_rows_for_bytes
+
+        narrow = tmp_path / "narrow.parquet"
+        wide = tmp_path / "wide.parquet"
+        pq.write_table(pa.table({"v": list(range(5000))}), narrow)
+        wide_values = ["x" * 1000 + str(i) for i in range(5000)]
+        pq.write_table(pa.table({"v": wide_values}), wide)
+
+        narrow_rows = _batch_rows_for_bytes(pq.ParquetFile(narrow), 10_000, 1 << 18)
+        wide_rows = _batch_rows_for_bytes(pq.ParquetFile(wide), 10_000, 1 << 18)
+
+        assert wide_rows < narrow_rows <= 10_000
+        assert wide_rows >= 1_024
+        # Explicit small batch_size is always honoured
+        assert _batch_rows_for_bytes(pq.ParquetFile(wide), 1, 1 << 18) == 1
+
+    def test_batch_rows_follow_selected_columns(self, tmp_path):
+        """With columns=, only the selected columns' width sizes the batch."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from xlr8.storage.reader import _batch_rows_for_bytes
+
+        path = tmp_path / "mixed.parquet"
+        wide_values = ["x" * 1000 + str(i) for i in range(5000)]
+        pq.write_table(
+            pa.table(
+                {
+                    "v": list(range(5000)),
+                    "meta": [{"w": w} for w in wide_values],
+                }
+            ),
+            path,
+        )
+        parquet_file = pq.ParquetFile(path)
+
+        def rows(columns):
+            return _batch_rows_for_bytes(parquet_file, 100_000, 1 << 20, columns)
+
+        assert rows(["v"]) > 10 * rows(None)
+        # A parent name selects its nested children
+        assert rows(["meta"]) == rows(["meta.w"]) < rows(["v"])
+
+    def test_footers_parsed_once_and_reused(self, multi_file_cache):
+        """Each file's footer is parsed once and reused by later scans."""
+        reader = ParquetReader(cache_dir=multi_file_cache)
+
+        list(reader.iter_documents())
+        cached = dict(reader._metadata)
+        list(reader.iter_documents())
+
+        assert set(cached) == set(reader.parquet_files)
+        assert all(reader._metadata[p] is cached[p] for p in cached)
+
+    def test_prefetch_preserves_file_order(self, multi_file_cache):
+        """Prefetched iteration yields the same documents in the same order."""
+        reader = ParquetReader(cache_dir=multi_file_cache)
+
+        sequential = list(reader.iter_documents(prefetch_batches=0))
+        prefetched = list(reader.iter_documents(prefetch_batches=2))
+
+        assert len(prefetched) == 15
+        assert prefetched == sequential
+
+    def test_prefetch_close_stops_background_reads(self, multi_file_cache):
+        """Closing a prefetching iterator early does not hang or leak the thread."""
+        import threading
+
+        reader = ParquetReader(cache_dir=multi_file_cache)
+
+        docs = reader.iter_documents(prefetch_batches=1)
+        assert next(docs) == {"part": 0, "row": 0}
+        docs.close()
+
+        assert not any(t.name == "xlr8-prefetch" for t in threading.enumerate())
+
+    def test_prefetch_reraises_read_errors(self, multi_file_cache):
+        """Errors in the background thread surface in the consumer."""
+        reader = ParquetReader(cache_dir=multi_file_cache)
+        reader.parquet_files[-1].write_bytes(b"not parquet")
+
+        docs = reader.iter_documents(prefetch_batches=2)
+
+        with pytest.raises(Exception, match="Parquet"):
+            list(docs)
+
+    def test_reuse_dict_yields_same_object(self, sample_parquet_cache):
+        """reuse_dict=True updates one dict in place with each row's values."""
+        reader = ParquetReader(cache_dir=sample_parquet_cache)
+
+        docs = reader.iter_documents(reuse_dict=True)
+        seen = [(id(doc), dict(doc)) for doc in docs]
+
+        assert len({doc_id for doc_id, _ in seen}) == 1
+        assert [doc for _, doc in seen] == list(reader.iter_documents())
+
+    def test_reuse_dict_yields_empty_rows_without_columns(self, sample_parquet_cache):
+        """columns=[] still yields one (empty) document per row."""
+        reader = ParquetReader(cache_dir=sample_parquet_cache)
+
+        reused = [dict(d) for d in reader.iter_documents(columns=[], reuse_dict=True)]
+
+        assert reused == list(reader.iter_documents(columns=[])) == [{}] * 3
+
+
+class TestIterBatches:
+    """Test iter_batches() Arrow streaming."""
+
+    def test_yields_record_batches(self, sample_parquet_cache):
+        """iter_batches() should yield Arrow record batches with all rows."""
+        import pyarrow as pa
+
+        reader = ParquetReader(cache_dir=sample_parquet_cache)
+
+        batches = list(reader.iter_batches(batch_size=2))
+
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        assert batches[0].schema.names == ["timestamp", "value", "name"]
+
+    def test_matches_iter_documents(self, sample_parquet_cache):
+        """iter_documents() is iter_batches() converted row by row."""
+        reader = ParquetReader(cache_dir=sample_parquet_cache)
+
+        rows = [row for b in reader.iter_batches() for row in b.to_pylist()]
+
+        assert rows == list(reader.iter_documents())
+
+    @pytest.mark.parametrize("prefetch_batches", [0, 2])
+    def test_time_range_prunes_files_and_rows(self, tmp_path, prefetch_batches):
+        """Files outside the range are skipped and rows are filtered exactly."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        cache_dir = tmp_path / "ts_cache"
+        cache_dir.mkdir()
+        for day in (1, 2, 3):
+            times = [datetime(2024, 1, day, h, tzinfo=timezone.utc) for h in (0, 12)]
+            table = pa.table(
+                {"timestamp": pa.array(times, type=pa.timestamp("ms", tz="UTC"))}
+            )
+            lo, hi = (int(t.timestamp()) for t in (times[0], times[-1]))
+            pq.write_table(table, cache_dir / f"ts_{lo}_{hi}_part_0000.parquet")
+
+        reader = ParquetReader(cache_dir=cache_dir)
+        # Corrupt the day-1 file: it must never be opened for a later range
+        reader.parquet_files[0].write_bytes(b"not parquet")
+
+        batches = reader.iter_batches(
+            prefetch_batches=prefetch_batches,
+            time_field="timestamp",
+            start_date=datetime(2024, 1, 2, 12, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 3, 12, tzinfo=timezone.utc),
+        )
+        times = [t for b in batches for t in b.column("timestamp").to_pylist()]
+
+        assert times == [
+            datetime(2024, 1, 2, 12, tzinfo=timezone.utc),
+            datetime(2024, 1, 3, 0, tzinfo=timezone.utc),
+        ]
+
+    @pytest.mark.parametrize("prefetch_batches", [0, 2])
+    def test_time_range_skips_files_without_time_field(
+        self, tmp_path, prefetch_batches
+    ):
+        """Rows with no time_field column are outside any requested range."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        ts = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        pq.write_table(
+            pa.table({"ts": pa.array([ts], type=pa.timestamp("ms", tz="UTC"))}),
+            tmp_path / "part_0000.parquet",
+        )
+        pq.write_table(pa.table({"value": [1.0]}), tmp_path / "part_0001.parquet")
+
+        reader = ParquetReader(cache_dir=tmp_path)
+        docs = reader.iter_documents(
+            prefetch_batches=prefetch_batches,
+            time_field="ts",
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        )
+
+        assert list(docs) == [{"ts": ts}]
+
+    def test_reads_only_requested_columns(self, sample_parquet_cache):
+        """columns= is pushed down; the time field is read only to filter."""
+        reader = ParquetReader(cache_dir=sample_parquet_cache)
+
+        batches = list(
+            reader.iter_batches(
+                columns=["value"],
+                time_field="timestamp",
+                start_date=datetime(2024, 1, 15, 1, tzinfo=timezone.utc),
+            )
+        )
+
+        assert [b.schema.names for b in batches] == [["value"]]
+        assert batches[0].column("value").to_pylist() == [43.1, 44.2]
+        assert list(reader.iter_documents(columns=["name"]))[0] == {"name": "test1"}
+
+    @pytest.mark.parametrize(
+        "strategy, expected",
+        [("float", [1.5, 7.0, None]), ("string", ["1.5", "7", "x"])],
+    )
+    def test_decodes_any_struct_columns(self, tmp_path, strategy, expected):
+        """Types.Any() structs are coalesced column-wise when a schema is given."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from xlr8.schema.types import Any
+
+        cache_dir = tmp_path / "any_cache"
+        cache_dir.mkdir()
+        values = pa.StructArray.from_arrays(
+            [
+                pa.array([1.5, None, None], type=pa.float64()),
+                pa.array([None, 7, None], type=pa.int64()),
+                pa.array([None, None, "x"], type=pa.string()),
+            ],
+            names=["float_value", "int64_value", "string_value"],
+        )
+        pq.write_table(pa.table({"value": values}), cache_dir / "part_0000.parquet")
+        schema = Schema(
+            time_field="timestamp",
+            fields={"timestamp": Timestamp(), "value": Any()},
+        )
+
+        reader = ParquetReader(cache_dir=cache_dir)
+        batches = reader.iter_batches(schema=schema, any_type_strategy=strategy)
+        decoded = [v for b in batches for v in b.column("value").to_pylist()]
+        raw = next(reader.iter_batches(schema=schema, any_type_strategy="keep_struct"))
+
+        assert decoded == expected
+        assert pa.types.is_struct(raw.column("value").type)
+
+    def test_any_string_strategy_matches_polars(self, tmp_path):
+        """String decoding formats floats like to_dataframe(engine="polars")."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from xlr8.schema.types import Any
+
+        values = pa.StructArray.from_arrays(
+            [
+                pa.array([1.0, float("nan"), 3e15, None]),
+                pa.array([None, None, None, 2]),
+            ],
+            names=["float_value", "int64_value"],
+        )
+        pq.write_table(pa.table({"value": values}), tmp_path / "part_0000.parquet")
+        schema = Schema(
+            time_field="timestamp",
+            fields={"timestamp": Timestamp(), "value": Any()},
+        )
+        reader = ParquetReader(cache_dir=tmp_path)
+
+        batch = next(reader.iter_batches(schema=schema, any_type_strategy="string"))
+        df = reader.to_dataframe(
+            engine="polars", schema=schema, any_type_strategy="string"
+        )
+
+        expected = ["1.0", "NaN", "3000000000000000.0", "2"]
+        assert batch.column("value").to_pylist() == expected
+        assert df["value"].to_list() == expected
+
+    def test_flattens_nested_structs_with_schema(self, tmp_path, simple_schema):
+        """Nested structs become dotted columns; parent nulls reach children."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        cache_dir = tmp_path / "struct_cache"
+        cache_dir.mkdir()
+        metadata = [
+            {"device_id": "d1", "location": {"site": "a"}},
+            None,
+        ]
+        pq.write_table(
+            pa.table({"metadata": metadata, "value": [1.0, 2.0]}),
+            cache_dir / "part_0000.parquet",
+        )
+
+        reader = ParquetReader(cache_dir=cache_dir)
+        batch = next(reader.iter_batches(schema=simple_schema))
+
+        assert batch.schema.names == [
+            "metadata.device_id",
+            "metadata.location.site",
+            "value",
+        ]
+        assert batch.column("metadata.location.site").to_pylist() == ["a", None]
+        assert next(reader.iter_batches()).schema.names == ["metadata", "value"]
+
 
 class TestToDataFrame:
     """Test to_dataframe() loading."""
@@ -157,6 +500,79 @@ class TestToDataFrame:
         # Should filter to only rows between 1-3
         assert len(df) >= 1  # At least the 1am and 2am rows
 
+    def test_pandas_attaches_any_columns_without_fragmenting(self, tmp_path):
+        """Many decoded Any columns don't trigger a PerformanceWarning."""
+        import warnings
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from xlr8.schema.types import Any
+
+        cache_dir = tmp_path / "any_cache"
+        cache_dir.mkdir()
+        values = pa.StructArray.from_arrays(
+            [pa.array([1.5, None]), pa.array([None, "x"])],
+            names=["float_value", "string_value"],
+        )
+        names = [f"value_{i}" for i in range(120)]
+        pq.write_table(
+            pa.table({name: values for name in names}),
+            cache_dir / "part_0000.parquet",
+        )
+        schema = Schema(
+            time_field="timestamp",
+            fields={"timestamp": Timestamp(), **{name: Any() for name in names}},
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", pd.errors.PerformanceWarning)
+            df = ParquetReader(cache_dir=cache_dir).to_dataframe(
+                engine="pandas", schema=schema
+            )
+
+        assert list(df.columns) == names
+        assert df["value_0"].tolist() == [1.5, "x"]
+
+    def test_polars_decodes_any_struct_in_lazy_scan(self, tmp_path):
+        """engine="polars" decodes Types.Any() structs as part of the scan."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from xlr8.schema.types import Any
+
+        values = pa.StructArray.from_arrays(
+            [pa.array([1.5, None]), pa.array([None, 7])],
+            names=["float_value", "int64_value"],
+        )
+        pq.write_table(pa.table({"value": values}), tmp_path / "part_0000.parquet")
+        schema = Schema(
+            time_field="timestamp",
+            fields={"timestamp": Timestamp(), "value": Any()},
+        )
+
+        df = ParquetReader(cache_dir=tmp_path).to_dataframe(
+            engine="polars", schema=schema
+        )
+
+        assert df["value"].to_list() == [1.5, 7.0]
+
+    def test_reads_files_as_one_dataset(self, tmp_path):
+        """Files are scanned together; columns missing in a file become null."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.table({"value": [1.0]}), tmp_path / "part_0000.parquet")
+        pq.write_table(
+            pa.table({"value": [2.0], "name": ["b"]}),
+            tmp_path / "part_0001.parquet",
+        )
+
+        df = ParquetReader(cache_dir=tmp_path).to_dataframe(engine="pandas")
+
+        assert df["value"].tolist() == [1.0, 2.0]
+        assert df["name"].tolist() == [None, "b"]
+
 
 class TestStatistics:
     """Test reader statistics."""
@@ -469,3 +885,37 @@ class TestDatetimeTimezoneHandling:
 
         assert len(df) == 2  # 00:00 and 01:00
         assert df["value"].tolist() == [1.0, 2.0]
+
+
+class TestObjectIdReconstruction:
+    """Test ObjectId reconstruction from hex strings."""
+
+    def test_reconstructs_objectids_and_keeps_nulls(self, tmp_path):
+        """ObjectId columns come back as ObjectId; nulls and "" pass through."""
+        from bson import ObjectId
+
+        from xlr8.schema.types import ObjectId as ObjectIdType
+
+        oid = ObjectId()
+        schema = Schema(
+            time_field="timestamp",
+            fields={"timestamp": Timestamp(), "sensor_id": ObjectIdType()},
+        )
+        df = pd.DataFrame({"sensor_id": [str(oid), None, ""]})
+
+        reader = ParquetReader(cache_dir=tmp_path)
+        out = reader._reconstruct_objectids(df, schema)
+
+        assert out["sensor_id"][0] == oid
+        assert isinstance(out["sensor_id"][0], ObjectId)
+        assert out["sensor_id"][1] is None
+        assert out["sensor_id"][2] == ""
+
+    def test_invalid_hex_raises_invalid_id(self):
+        """Invalid ObjectId strings still raise bson's InvalidId."""
+        from bson.errors import InvalidId
+
+        from xlr8.storage.reader import _objectid_from_hex
+
+        with pytest.raises(InvalidId):
+            _objectid_from_hex("zz" * 12)